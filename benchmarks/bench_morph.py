@@ -0,0 +1,256 @@
+"""
+Headless benchmarks for the WeaveCameraMorph addon. Loads the addon file, registers it and times
+its hot paths; the addon itself carries no benchmark code.
+
+Run with Blender, e.g.:
+    blender -b --factory-startup --python benchmarks/bench_morph.py -- --benchmark-startup [file.blend ...]
+    blender -b --factory-startup --python benchmarks/bench_morph.py -- --benchmark --objects 10000 --cameras 50 \\
+        --frames 250 --output new.json [--compare old.json --threshold 0.15]
+"""
+
+import argparse
+import importlib.util
+import json
+import math
+import os
+import sys
+from time import perf_counter
+
+import bpy
+
+ADDON_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src", "weave-camera-morph_v1.py")
+
+def load_addon(path=ADDON_PATH):
+    """Imports the addon file as a module (its name is not a valid identifier) and registers it."""
+    spec = importlib.util.spec_from_file_location("weave_camera_morph", path)
+    addon = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = addon
+    spec.loader.exec_module(addon)
+    addon.register()
+    return addon
+
+class BenchmarkMismatchError(Exception):
+    """Raised when two benchmark results were produced with different scene parameters."""
+
+def _timing_summary(samples):
+    """min/mean/p95/max of a list of durations (seconds), in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "runs": len(ordered),
+        "min_ms": ordered[0] * 1000.0,
+        "mean_ms": sum(ordered) / len(ordered) * 1000.0,
+        "p95_ms": ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] * 1000.0,
+        "max_ms": ordered[-1] * 1000.0,
+    }
+
+def benchmark_startup(addon, iterations=20, blend_files=()):
+    """Measures time-to-register and load_post overhead (current file, then each given file)."""
+    register_times = []
+    for _ in range(iterations):
+        addon.unregister()
+        start = perf_counter()
+        addon.register()
+        register_times.append(perf_counter() - start)
+
+    def time_load_handler():
+        samples = []
+        for _ in range(iterations):
+            start = perf_counter()
+            addon.morph_load_post_handler(None)
+            samples.append(perf_counter() - start)
+        return _timing_summary(samples)
+
+    load_times = {"<startup file>": time_load_handler()}
+    for path in blend_files:
+        bpy.ops.wm.open_mainfile(filepath=path)
+        load_times[path] = time_load_handler()
+    return {"register": _timing_summary(register_times), "load_post": load_times}
+
+def build_benchmark_scene(addon, scene, num_objects, num_cameras, num_frames):
+    """
+    Fills the scene with a synthetic workload: num_objects empties (filler for scene-wide scans
+    and depsgraph size), num_cameras animated source cameras and one morph rig whose slider is
+    keyed across the whole list over num_frames frames. Returns the morph camera.
+    """
+    scene.frame_start = 1
+    scene.frame_end = num_frames
+    # Linking checks for duplicates, so spread objects over sub-collections to keep it linear
+    chunk_size = 1000
+    collection = None
+    for i in range(num_objects):
+        if i % chunk_size == 0:
+            collection = bpy.data.collections.new(f"BenchFiller.{i // chunk_size:03d}")
+            scene.collection.children.link(collection)
+        obj = bpy.data.objects.new(f"BenchFiller.{i:06d}", None)
+        obj.location = (i % 100, (i // 100) % 100, i // 10000)
+        collection.objects.link(obj)
+
+    source_cameras = []
+    for i in range(num_cameras):
+        if i % chunk_size == 0:
+            collection = bpy.data.collections.new(f"BenchCameras.{i // chunk_size:03d}")
+            scene.collection.children.link(collection)
+        cam_obj = bpy.data.objects.new(f"BenchCamera.{i:05d}", bpy.data.cameras.new(f"BenchCameraData.{i:05d}"))
+        angle = 2.0 * math.pi * i / max(1, num_cameras)
+        cam_obj.location = (20.0 * math.cos(angle), 20.0 * math.sin(angle), 5.0)
+        cam_obj.rotation_euler = (1.2, 0.0, angle + math.pi / 2.0)
+        cam_obj.data.lens = 35.0 + (i % 5) * 10.0
+        # Animated sources, so the depsgraph has real work on every frame
+        cam_obj.keyframe_insert(data_path="location", frame=scene.frame_start)
+        cam_obj.location.z += 2.0
+        cam_obj.keyframe_insert(data_path="location", frame=scene.frame_end)
+        collection.objects.link(cam_obj)
+        source_cameras.append(cam_obj)
+
+    addon.ensure_morph_runtime()
+    morph_cam_obj = bpy.data.objects.new("BenchMorphCamera", bpy.data.cameras.new("BenchMorphCameraData"))
+    morph_cam_obj["is_morph_camera"] = True
+    scene.collection.objects.link(morph_cam_obj)
+    morph_cam_obj.morph_props.is_morph_camera = True
+    morph_cam_obj.morph_props.arc_control = 0.3
+    for cam_obj in source_cameras:
+        morph_cam_obj.morph_props.morph_list.add().camera = cam_obj
+    scene.camera = morph_cam_obj
+    addon.update_slider_range(scene, morph_cam_obj)
+
+    scene.morph_slider = 0.0
+    scene.keyframe_insert(data_path="morph_slider", frame=scene.frame_start)
+    scene.morph_slider = float(max(0, num_cameras - 1))
+    scene.keyframe_insert(data_path="morph_slider", frame=scene.frame_end)
+    return morph_cam_obj
+
+def run_benchmarks(addon, num_objects=1000, num_cameras=10, num_frames=100, repeats=50):
+    """Times the addon's hot paths on a synthetic scene. Returns a JSON-serializable dict."""
+    scene = bpy.context.scene
+    start = perf_counter()
+    morph_cam_obj = build_benchmark_scene(addon, scene, num_objects, num_cameras, num_frames)
+    setup_seconds = perf_counter() - start
+    frames = range(scene.frame_start, scene.frame_end + 1)
+    results = {}
+
+    # Frame change handler, on top of the frame change itself
+    samples = []
+    for frame in frames:
+        scene.frame_set(frame)
+        start = perf_counter()
+        addon.morph_frame_change_handler(scene)
+        samples.append(perf_counter() - start)
+    results["frame_change_handler"] = _timing_summary(samples)
+
+    # Slider update callback latency (set through RNA, as the UI does)
+    max_value = float(max(0, num_cameras - 1))
+    samples = []
+    for i in range(repeats):
+        value = max_value * i / max(1, repeats - 1)
+        start = perf_counter()
+        scene.morph_slider = value
+        samples.append(perf_counter() - start)
+    results["slider_callback"] = _timing_summary(samples)
+
+    # List edits: everything the list operators run after an edit (render table and path
+    # invalidation, then the range update), and the range update with a scene-wide lookup
+    samples = []
+    lookup_samples = []
+    morph_list = morph_cam_obj.morph_props.morph_list
+    for _ in range(repeats):
+        morph_list.add()
+        start = perf_counter()
+        addon.on_morph_list_changed(morph_cam_obj)
+        addon.update_slider_range(scene, morph_cam_obj)
+        samples.append(perf_counter() - start)
+        morph_list.remove(len(morph_list) - 1)
+        start = perf_counter()
+        addon.update_slider_range(scene)
+        lookup_samples.append(perf_counter() - start)
+    results["list_edit"] = _timing_summary(samples)
+    results["update_slider_range_lookup"] = _timing_summary(lookup_samples)
+
+    # Full bake of the rig over the frame range
+    start = perf_counter()
+    bake_results, _ = addon.bake_scene_morph_cameras(scene, [morph_cam_obj])
+    bake_seconds = perf_counter() - start
+    _, baked_camera_obj, key_count, _ = bake_results[0]
+    results["bake"] = {"wall_ms": bake_seconds * 1000.0, "keyframes": key_count}
+    bpy.data.objects.remove(baked_camera_obj)
+
+    return {
+        "meta": {
+            "addon_version": list(addon.bl_info["version"]),
+            "blender_version": list(bpy.app.version),
+            "objects": num_objects,
+            "cameras": num_cameras,
+            "frames": num_frames,
+            "repeats": repeats,
+            "setup_ms": setup_seconds * 1000.0,
+        },
+        "results": results,
+    }
+
+def compare_benchmarks(current, baseline, threshold=0.10):
+    """
+    Compares two run_benchmarks results. Returns a list of regressions: timings slower than the
+    baseline by more than `threshold` (fraction), and keyframe counts that changed.
+    Raises BenchmarkMismatchError if the runs used different scene sizes.
+    """
+    mismatched = [
+        f"{key}: {baseline.get('meta', {}).get(key)} -> {current['meta'].get(key)}"
+        for key in ("objects", "cameras", "frames")
+        if current["meta"].get(key) != baseline.get("meta", {}).get(key)
+    ]
+    if mismatched:
+        raise BenchmarkMismatchError("Results are not comparable, scene parameters differ from the baseline (" + ", ".join(mismatched) + ")")
+
+    regressions = []
+    for name, entry in current["results"].items():
+        base_entry = baseline.get("results", {}).get(name)
+        if not base_entry:
+            continue
+        for key in ("mean_ms", "wall_ms"):
+            if key in entry and key in base_entry and base_entry[key] > 0.0:
+                ratio = entry[key] / base_entry[key]
+                if ratio > 1.0 + threshold:
+                    regressions.append(f"{name}.{key}: {base_entry[key]:.3f} -> {entry[key]:.3f} ms ({(ratio - 1.0) * 100.0:+.1f}%)")
+        if "keyframes" in entry and entry.get("keyframes") != base_entry.get("keyframes"):
+            regressions.append(f"{name}.keyframes: {base_entry.get('keyframes')} -> {entry['keyframes']}")
+    return regressions
+
+def main(script_args):
+    parser = argparse.ArgumentParser(prog="bench_morph.py")
+    mode = parser.add_mutually_exclusive_group(required=True)
+    mode.add_argument("--benchmark-startup", action="store_true", help="Time registration and the load handler")
+    mode.add_argument("--benchmark", action="store_true", help="Time hot paths on a synthetic scene")
+    parser.add_argument("--objects", type=int, default=1000)
+    parser.add_argument("--cameras", type=int, default=10)
+    parser.add_argument("--frames", type=int, default=100)
+    parser.add_argument("--repeats", type=int, default=50)
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Allowed slowdown vs. the baseline (fraction)")
+    parser.add_argument("blend_files", nargs="*", help="Files to load for --benchmark-startup")
+    args = parser.parse_args(script_args)
+
+    addon = load_addon()
+    if args.benchmark_startup:
+        report = benchmark_startup(addon, blend_files=args.blend_files)
+    else:
+        report = run_benchmarks(addon, args.objects, args.cameras, args.frames, args.repeats)
+    print(json.dumps(report, indent=2))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare and args.benchmark:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        try:
+            regressions = compare_benchmarks(report, baseline, args.threshold)
+        except BenchmarkMismatchError as e:
+            print(f"ERROR {e}")
+            return 2
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []))
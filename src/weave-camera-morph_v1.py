@@ -9,17 +9,107 @@ bl_info = {
 }
 
 import bpy
-from bpy.props import PointerProperty, CollectionProperty, FloatProperty, IntProperty
+from bpy.props import PointerProperty, CollectionProperty, FloatProperty, IntProperty, BoolProperty, EnumProperty, StringProperty
 from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy_extras.io_utils import ExportHelper
 from mathutils import Vector, Euler
 import functools # For persistent handlers
+import logging
+from array import array
+from collections import deque
+import math
+from time import perf_counter
+import zlib
+
+# --- Logging ---
+# All addon output goes through this logger so it can be silenced (or made verbose)
+# from the UI instead of printing unconditionally from hot paths.
+log = logging.getLogger("WeaveCameraMorph")
+if not log.handlers:
+    _log_handler = logging.StreamHandler()
+    _log_handler.setFormatter(logging.Formatter("%(name)s %(levelname)s: %(message)s"))
+    log.addHandler(_log_handler)
+    log.setLevel(logging.WARNING)
+    log.propagate = False
+
+# --- Profiling ---
+class MorphProfiler:
+    """
+    Low-overhead timing/counter store for the addon's hot paths.
+    When disabled, instrumented code only pays for a single attribute check.
+    """
+    MAX_SAMPLES = 2048 # Per-section window used for the p95 estimate
+
+    def __init__(self):
+        self.enabled = False
+        self.reset()
+
+    def reset(self):
+        self.sections = {} # name -> [call_count, total_seconds, deque(recent samples)]
+        self.caches = {} # name -> [hits, misses]
+
+    def record(self, name, seconds):
+        entry = self.sections.get(name)
+        if entry is None:
+            entry = self.sections[name] = [0, 0.0, deque(maxlen=self.MAX_SAMPLES)]
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2].append(seconds)
+
+    def cache(self, name, hit):
+        entry = self.caches.get(name)
+        if entry is None:
+            entry = self.caches[name] = [0, 0]
+        entry[0 if hit else 1] += 1
+
+    def stats(self):
+        """Returns {section: {count, total_ms, mean_ms, p95_ms}}, sorted by total time."""
+        result = {}
+        for name, (count, total, samples) in sorted(self.sections.items(), key=lambda kv: -kv[1][1]):
+            ordered = sorted(samples)
+            p95 = ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))] if ordered else 0.0
+            result[name] = {
+                "count": count,
+                "total_ms": total * 1000.0,
+                "mean_ms": (total / count) * 1000.0 if count else 0.0,
+                "p95_ms": p95 * 1000.0,
+            }
+        return result
+
+    def to_dict(self):
+        return {
+            "sections": self.stats(),
+            "caches": {name: {"hits": h, "misses": m} for name, (h, m) in sorted(self.caches.items())},
+        }
+
+_profiler = MorphProfiler()
+
+def profiled_method(section):
+    """
+    Decorator timing an operator method `(self, context)` under `section` while profiling is on.
+    The wrapper keeps the exact signature: Blender checks the argument count of registered methods.
+    Hot paths (solve, handlers) are timed inline instead, so they pay no extra call when profiling is off.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, context):
+            if not _profiler.enabled:
+                return method(self, context)
+            start = perf_counter()
+            try:
+                return method(self, context)
+            finally:
+                _profiler.record(section, perf_counter() - start)
+        return wrapper
+    return decorator
 
 # --- Property Group for the List ---
 class MorphListItem(PropertyGroup):
     camera: PointerProperty(
         name="Camera",
         type=bpy.types.Object,
-        poll=lambda self, obj: obj.type == 'CAMERA' and not obj.get("is_morph_camera", False) # Prevent adding morph cam itself
+        poll=lambda self, obj: obj.type == 'CAMERA' and not obj.get("is_morph_camera", False), # Prevent adding morph cam itself
+        update=lambda self, context: _morph_list_item_camera_update(self, context)
     )
 
 # --- UI List ---
@@ -57,6 +147,8 @@ class AddMorphCameraOperator(Operator):
         loc = scene.cursor.location
         rot = (0.0, 0.0, 0.0)
 
+        ensure_morph_runtime() # First rig in this session
+
         # Check if a morph camera already exists (optional, maybe allow multiple?)
         existing_morph_cams = [o for o in scene.objects if o.get("is_morph_camera")]
         if existing_morph_cams:
@@ -79,6 +171,7 @@ class AddMorphCameraOperator(Operator):
 
         # Initialize properties directly on the object
         morph_camera_obj.morph_props.is_morph_camera = True # Use the property group flag
+        update_slider_range(scene, morph_camera_obj)
 
         self.report({'INFO'}, "Morph Camera added.")
         return {'FINISHED'}
@@ -94,6 +187,8 @@ class AddSelectedCamerasToListOperator(Operator):
         return obj and obj.type == 'CAMERA' and obj.get("is_morph_camera")
 
     def execute(self, context):
+        global _list_batch_edit
+        ensure_morph_runtime() # Rig may exist without a file load (appended, linked or scripted)
         morph_cam_obj = context.object
         morph_props = morph_cam_obj.morph_props
         selected_cameras = [
@@ -106,16 +201,21 @@ class AddSelectedCamerasToListOperator(Operator):
             return {'CANCELLED'}
 
         added_count = 0
-        for selected_camera in selected_cameras:
-            # Avoid duplicates
-            if selected_camera not in [item.camera for item in morph_props.morph_list]:
-                item = morph_props.morph_list.add()
-                item.camera = selected_camera
-                added_count += 1
+        _list_batch_edit = True
+        try:
+            for selected_camera in selected_cameras:
+                # Avoid duplicates
+                if selected_camera not in [item.camera for item in morph_props.morph_list]:
+                    item = morph_props.morph_list.add()
+                    item.camera = selected_camera
+                    added_count += 1
+        finally:
+            _list_batch_edit = False
 
         if added_count > 0:
             morph_props.active_morph_camera_index = len(morph_props.morph_list) - 1
-            update_slider_range(context.scene)
+            on_morph_list_changed(morph_cam_obj)
+            update_slider_range(context.scene, morph_cam_obj)
             # Trigger immediate update if possible
             if context.scene.camera == morph_cam_obj:
                  trigger_morph_update(context.scene, morph_cam_obj)
@@ -136,12 +236,19 @@ class AddCameraToListOperator(Operator):
         return obj and obj.type == 'CAMERA' and obj.get("is_morph_camera")
 
     def execute(self, context):
+        global _list_batch_edit
+        ensure_morph_runtime() # Rig may exist without a file load (appended, linked or scripted)
         morph_cam_obj = context.object
         morph_props = morph_cam_obj.morph_props
         item = morph_props.morph_list.add()
-        item.camera = None # Add an empty item
+        _list_batch_edit = True
+        try:
+            item.camera = None # Add an empty item
+        finally:
+            _list_batch_edit = False
         morph_props.active_morph_camera_index = len(morph_props.morph_list) - 1
-        update_slider_range(context.scene)
+        on_morph_list_changed(morph_cam_obj)
+        update_slider_range(context.scene, morph_cam_obj)
         # Trigger immediate update if possible
         if context.scene.camera == morph_cam_obj:
             trigger_morph_update(context.scene, morph_cam_obj)
@@ -158,6 +265,7 @@ class RemoveCameraFromListOperator(Operator):
         return obj and obj.type == 'CAMERA' and obj.get("is_morph_camera") and len(obj.morph_props.morph_list) > 0
 
     def execute(self, context):
+        ensure_morph_runtime() # Rig may exist without a file load (appended, linked or scripted)
         morph_cam_obj = context.object
         morph_props = morph_cam_obj.morph_props
         index = morph_props.active_morph_camera_index
@@ -166,7 +274,8 @@ class RemoveCameraFromListOperator(Operator):
             morph_props.morph_list.remove(index)
             # Adjust index safely
             morph_props.active_morph_camera_index = min(max(0, index -1), len(morph_props.morph_list) - 1)
-            update_slider_range(context.scene)
+            on_morph_list_changed(morph_cam_obj)
+            update_slider_range(context.scene, morph_cam_obj)
             # Trigger immediate update if possible
             if context.scene.camera == morph_cam_obj:
                 trigger_morph_update(context.scene, morph_cam_obj)
@@ -187,11 +296,13 @@ class MoveCameraUpOperator(Operator):
         return obj and obj.type == 'CAMERA' and obj.get("is_morph_camera") and obj.morph_props.active_morph_camera_index > 0
 
     def execute(self, context):
+        ensure_morph_runtime() # Rig may exist without a file load (appended, linked or scripted)
         morph_cam_obj = context.object
         morph_props = morph_cam_obj.morph_props
         index = morph_props.active_morph_camera_index
         morph_props.morph_list.move(index, index - 1)
         morph_props.active_morph_camera_index -= 1
+        on_morph_list_changed(morph_cam_obj)
         # Trigger immediate update if possible
         if context.scene.camera == morph_cam_obj:
             trigger_morph_update(context.scene, morph_cam_obj)
@@ -211,20 +322,126 @@ class MoveCameraDownOperator(Operator):
         return index < len(obj.morph_props.morph_list) - 1
 
     def execute(self, context):
+        ensure_morph_runtime() # Rig may exist without a file load (appended, linked or scripted)
         morph_cam_obj = context.object
         morph_props = morph_cam_obj.morph_props
         index = morph_props.active_morph_camera_index
         morph_props.morph_list.move(index, index + 1)
         morph_props.active_morph_camera_index += 1
+        on_morph_list_changed(morph_cam_obj)
         # Trigger immediate update if possible
         if context.scene.camera == morph_cam_obj:
             trigger_morph_update(context.scene, morph_cam_obj)
         return {'FINISHED'}
 
+class ScrubMorphSliderOperator(Operator):
+    bl_idname = "morph_list.scrub"
+    bl_label = "Scrub Morph"
+    bl_description = ("Drag horizontally to scrub the morph slider with a fast preview (Shift for precision). "
+                      "Click or Enter to confirm, Esc or right-click to cancel")
+    bl_options = {'REGISTER', 'UNDO', 'BLOCKING'}
+
+    refresh_rate: FloatProperty(
+        name="Refresh Rate",
+        description="Preview updates per second while dragging (match the display refresh rate)",
+        default=60.0, min=1.0, max=240.0
+        )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'CAMERA' and obj.get("is_morph_camera") and hasattr(obj, 'morph_props') and len(obj.morph_props.morph_list) >= 2
+
+    def invoke(self, context, event):
+        ensure_morph_runtime() # Rig may exist without a file load (appended, linked or scripted)
+        scene = context.scene
+        morph_list = context.object.morph_props.morph_list
+        self._morph_cam_obj = context.object
+        self._start_value = self._value = scene.morph_slider
+        self._max_value = float(len(morph_list) - 1)
+        self._last_x = event.mouse_x
+        self._pending = False
+        # Dragging across the whole region covers the whole list
+        region_width = context.region.width if context.region else 1000
+        self._units_per_pixel = self._max_value / max(1, region_width)
+
+        # Endpoint cache: every listed camera is snapshotted once, skipping focus-object evaluation,
+        # so previews while dragging never touch the depsgraph
+        depsgraph = context.evaluated_depsgraph_get()
+        self._snapshots = {}
+        for item in morph_list:
+            get_camera_snapshot(item.camera, depsgraph, self._snapshots, resolve_focus=False)
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(1.0 / self.refresh_rate, window=context.window)
+        wm.modal_handler_add(self)
+        self._update_header(context)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'MOUSEMOVE':
+            # Only accumulate here; the preview runs on the next timer tick (coalesces input)
+            scale = 0.1 if event.shift else 1.0
+            delta = (event.mouse_x - self._last_x) * self._units_per_pixel * scale
+            self._last_x = event.mouse_x
+            self._value = max(0.0, min(self._value + delta, self._max_value))
+            self._pending = True
+        elif event.type == 'TIMER':
+            if self._pending:
+                self._pending = False
+                self._preview(context)
+        elif (event.type == 'LEFTMOUSE' and event.value == 'RELEASE') or (event.type in {'RET', 'NUMPAD_ENTER'} and event.value == 'PRESS'):
+            self._finish(context)
+            # Goes through the update callback: one full-quality solve, including focus objects
+            context.scene.morph_slider = self._value
+            return {'FINISHED'}
+        elif event.type in {'RIGHTMOUSE', 'ESC'} and event.value == 'PRESS':
+            self._finish(context)
+            context.scene.morph_slider = self._start_value
+            return {'CANCELLED'}
+        return {'RUNNING_MODAL'}
+
+    def cancel(self, context):
+        # Cancelled by Blender (file load, window close): undo the preview like Esc does
+        self._finish(context)
+        try:
+            context.scene.morph_slider = self._start_value # Full-quality solve again
+        except Exception as e:
+            log.warning("Could not restore the morph slider after scrubbing: %s", e)
+
+    @profiled_method("scrub_preview")
+    def _preview(self, context):
+        # Write the raw slider storage directly so the update callback (full solve) doesn't fire
+        context.scene[_SLIDER_VALUE_KEY] = self._value
+        state = solve_morph_state(self._morph_cam_obj.morph_props, self._value, None, self._snapshots)
+        if state is not None:
+            apply_morph_state(self._morph_cam_obj, state)
+        self._update_header(context)
+
+    def _update_header(self, context):
+        if context.area:
+            context.area.header_text_set(f"Morph: {self._value:.3f} / {self._max_value:.0f}")
+
+    def _finish(self, context):
+        if self._timer:
+            context.window_manager.event_timer_remove(self._timer)
+            self._timer = None
+        if context.area:
+            context.area.header_text_set(None)
+
+# Shared by the bake operators
+_BAKE_ROTATION_ITEMS = [
+    ('EULER', "Euler (XYZ)", "Key rotation_euler, filtered for continuity so there are no 180 degree flips"),
+    ('QUATERNION', "Quaternion", "Key rotation_quaternion directly, with hemisphere-consistent signs"),
+]
+
 class BakeMorphCameraOperator(Operator):
     bl_idname = "morph_list.bake_morph_camera"
     bl_label = "Bake Morph Animation"
     bl_description = "Bakes the morph camera's animation to a new standard camera"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    rotation_mode: EnumProperty(name="Rotation", items=_BAKE_ROTATION_ITEMS, default='EULER')
 
     @classmethod
     def poll(cls, context):
@@ -233,7 +450,9 @@ class BakeMorphCameraOperator(Operator):
         return obj and obj.type == 'CAMERA' and obj.get("is_morph_camera") and hasattr(obj, 'morph_props') and len(obj.morph_props.morph_list) >= 2
 
 
+    @profiled_method("bake")
     def execute(self, context):
+        ensure_morph_runtime() # Rig may exist without a file load (appended, linked or scripted)
         scene = context.scene
         morph_cam_obj = context.object # The camera with the morph properties
         morph_props = morph_cam_obj.morph_props # Assuming poll passed, this exists
@@ -243,75 +462,14 @@ class BakeMorphCameraOperator(Operator):
             self.report({'ERROR'}, "Need at least two cameras in the list to bake.")
             return {'CANCELLED'}
 
-        # Create a new camera to bake the animation
-        baked_camera_data = bpy.data.cameras.new(name=f"{morph_cam_obj.name}_BakedData")
-        baked_camera_obj = bpy.data.objects.new(name=f"{morph_cam_obj.name}_Baked", object_data=baked_camera_data)
-        scene.collection.objects.link(baked_camera_obj)
-
-        # Store original frame (useful for restoring state after baking)
-        original_frame = scene.frame_current
-        # Store slider value too, mainly for restoring non-animated state accurately
-        original_slider = scene.morph_slider if hasattr(scene, 'morph_slider') else 0.0
-
         frame_start = scene.frame_start
         frame_end = scene.frame_end
+        log.info("Baking Morph Camera animation from frame %d to %d...", frame_start, frame_end)
 
-       
-        print(f"Baking Morph Camera animation from frame {frame_start} to {frame_end}...") # Info
-
-        # Bake the animation frame by frame
-        for frame in range(frame_start, frame_end + 1):
-            # Set the current frame. This automatically updates scene.morph_slider if it's keyframed.
-            scene.frame_set(frame)
-            # print(f"  Baking frame {frame}, Slider value: {scene.morph_slider:.3f}") # Debug Frame/Slider
-
-            # Ensure the morph camera is updated based on the slider value *at this frame*
-            trigger_morph_update(scene, morph_cam_obj)
-
-            # Copy properties from the *current state* of the morph camera to the baked camera
-            baked_camera_obj.location = morph_cam_obj.location
-            # Ensure consistent rotation order if needed (e.g., 'XYZ')
-            baked_camera_obj.rotation_euler = morph_cam_obj.rotation_euler
-            baked_camera_data.lens = morph_cam_obj.data.lens
-
-            # --- Copy other relevant properties ---
-            # Example: Depth of Field
-            baked_camera_data.dof.use_dof = morph_cam_obj.data.dof.use_dof
-            baked_camera_data.dof.focus_distance = morph_cam_obj.data.dof.focus_distance
-            baked_camera_data.dof.aperture_fstop = morph_cam_obj.data.dof.aperture_fstop
-            # Example: Clipping
-            baked_camera_data.clip_start = morph_cam_obj.data.clip_start
-            baked_camera_data.clip_end = morph_cam_obj.data.clip_end
-            # Example: Sensor Fit/Size (Important if source cameras differ)
-            baked_camera_data.sensor_fit = morph_cam_obj.data.sensor_fit
-            baked_camera_data.sensor_width = morph_cam_obj.data.sensor_width
-            baked_camera_data.sensor_height = morph_cam_obj.data.sensor_height
-            # ... copy any other properties you interpolated in update_morph_camera ...
-
-
-            # --- Insert Keyframes for the baked camera ---
-            baked_camera_obj.keyframe_insert(data_path="location", frame=frame)
-            baked_camera_obj.keyframe_insert(data_path="rotation_euler", frame=frame)
-            baked_camera_data.keyframe_insert(data_path="lens", frame=frame)
-
-            # Keyframe other copied properties
-            baked_camera_data.dof.keyframe_insert(data_path="focus_distance", frame=frame)
-            baked_camera_data.dof.keyframe_insert(data_path="aperture_fstop", frame=frame)
-            baked_camera_data.keyframe_insert(data_path="clip_start", frame=frame)
-            baked_camera_data.keyframe_insert(data_path="clip_end", frame=frame)
-            baked_camera_data.keyframe_insert(data_path="sensor_fit", frame=frame)
-            baked_camera_data.keyframe_insert(data_path="sensor_width", frame=frame)
-            baked_camera_data.keyframe_insert(data_path="sensor_height", frame=frame)
-            # ... keyframe others ...
-
-
-        # Restore original frame
-        scene.frame_set(original_frame)
-        # Restore slider value too, just in case frame_set didn't perfectly restore non-animated state
-        if hasattr(scene, 'morph_slider'):
-             scene.morph_slider = original_slider
-        print(f"Baking complete. Restored frame to {original_frame} and slider to {original_slider:.3f}")
-
+        # Samples every frame, then writes all keys in one go (restores the current frame)
+        results, _ = bake_scene_morph_cameras(scene, [morph_cam_obj], self.rotation_mode)
+        morph_cam_obj, baked_camera_obj, key_count, seconds = results[0]
+        log.info("Baking complete: %d keyframes in %.3f s.", key_count, seconds)
 
         # Make baked camera the active scene camera
         scene.camera = baked_camera_obj
@@ -322,6 +480,128 @@ class BakeMorphCameraOperator(Operator):
         self.report({'INFO'}, f"Baked animation to '{baked_camera_obj.name}'.")
         return {'FINISHED'}
 
+class BakeAllMorphCamerasOperator(Operator):
+    bl_idname = "morph_list.bake_all"
+    bl_label = "Bake All Morph Cameras"
+    bl_description = ("Bakes every morph camera in every scene over its scene's frame range. "
+                      "Each frame is evaluated once per scene and shared source cameras are read once")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    rotation_mode: EnumProperty(name="Rotation", items=_BAKE_ROTATION_ITEMS, default='EULER')
+
+    @profiled_method("bake_all")
+    def execute(self, context):
+        rigs_by_scene = {}
+        for scene in bpy.data.scenes:
+            rigs = [obj for obj in find_morph_cameras(scene) if len(obj.morph_props.morph_list) >= 2]
+            if rigs:
+                rigs_by_scene[scene] = rigs
+        if not rigs_by_scene:
+            self.report({'WARNING'}, "No morph cameras with at least two cameras found in any scene.")
+            return {'CANCELLED'}
+        ensure_morph_runtime()
+
+        total_rigs = 0
+        for scene, rigs in rigs_by_scene.items():
+            results, eval_seconds = bake_scene_morph_cameras(scene, rigs, self.rotation_mode)
+            log.info("Scene '%s': frame evaluation %.3f s shared by %d rig(s)", scene.name, eval_seconds, len(rigs))
+            for morph_cam_obj, baked_camera_obj, key_count, seconds in results:
+                self.report({'INFO'}, f"{scene.name}/{morph_cam_obj.name} -> {baked_camera_obj.name}: {key_count} keyframes, {seconds:.3f} s")
+            total_rigs += len(results)
+
+        self.report({'INFO'}, f"Baked {total_rigs} morph camera(s) in {len(rigs_by_scene)} scene(s).")
+        return {'FINISHED'}
+
+class BakeMorphPathOperator(Operator):
+    bl_idname = "morph_list.bake_path"
+    bl_label = "Bake Morph Path"
+    bl_description = ("Samples the morph trajectory (including arc control) into a poly curve or mesh object. "
+                      "The object is kept up to date when the list or arc changes")
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'CAMERA' and obj.get("is_morph_camera") and hasattr(obj, 'morph_props') and len(obj.morph_props.morph_list) >= 2
+
+    @profiled_method("bake_path")
+    def execute(self, context):
+        morph_cam_obj = context.object
+        count = refresh_morph_path(morph_cam_obj, context.evaluated_depsgraph_get(), create=True)
+        if count < 2:
+            self.report({'WARNING'}, "Not enough valid cameras in the list to build a path.")
+            return {'CANCELLED'}
+        path_obj = morph_cam_obj.morph_props.path_object
+        self.report({'INFO'}, f"Wrote {count} path points to '{path_obj.name}'.")
+        return {'FINISHED'}
+
+class FreezeMorphForRenderOperator(Operator):
+    bl_idname = "morph_list.freeze_for_render"
+    bl_label = "Freeze for Render"
+    bl_description = ("Solves the morph camera over the render range (with motion blur sub-samples) into a "
+                      "table stored on the camera, so final renders only look values up")
+
+    subframe_samples: IntProperty(
+        name="Sub-samples per Frame",
+        description="Samples per frame when motion blur is enabled (ignored otherwise)",
+        default=4, min=1, max=64
+        )
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and obj.type == 'CAMERA' and obj.get("is_morph_camera") and hasattr(obj, 'morph_props') and len(obj.morph_props.morph_list) >= 2
+
+    @profiled_method("freeze")
+    def execute(self, context):
+        ensure_morph_runtime() # Rig may exist without a file load (appended, linked or scripted)
+        scene = context.scene
+        morph_cam_obj = context.object
+        count = freeze_render_table(scene, morph_cam_obj, self.subframe_samples)
+        self.report({'INFO'}, f"Froze {count} samples for '{morph_cam_obj.name}'.")
+        return {'FINISHED'}
+
+class ClearMorphRenderTableOperator(Operator):
+    bl_idname = "morph_list.clear_render_table"
+    bl_label = "Unfreeze"
+    bl_description = "Removes the frozen render table so renders solve the morph live again"
+
+    @classmethod
+    def poll(cls, context):
+        obj = context.object
+        return obj and _RENDER_TABLE_KEY in obj
+
+    def execute(self, context):
+        clear_render_table(context.object)
+        return {'FINISHED'}
+
+class ResetMorphProfilingOperator(Operator):
+    bl_idname = "morph_profiling.reset"
+    bl_label = "Reset Profiling Data"
+    bl_description = "Clears all recorded morph camera timings and counters"
+
+    def execute(self, context):
+        _profiler.reset()
+        return {'FINISHED'}
+
+class ExportMorphProfilingOperator(Operator, ExportHelper):
+    bl_idname = "morph_profiling.export"
+    bl_label = "Export Profiling Data"
+    bl_description = "Writes the recorded morph camera timings and counters to a JSON file"
+
+    filename_ext = ".json"
+    filter_glob: StringProperty(default="*.json", options={'HIDDEN'})
+
+    def execute(self, context):
+        import json # Only needed here; keeps addon startup lean
+        try:
+            with open(self.filepath, 'w') as f:
+                json.dump(_profiler.to_dict(), f, indent=2)
+        except OSError as e:
+            self.report({'ERROR'}, f"Could not write profiling data: {e}")
+            return {'CANCELLED'}
+        self.report({'INFO'}, f"Profiling data written to '{self.filepath}'.")
+        return {'FINISHED'}
+
 # --- Panels ---
 class MORPHCAMERA_PT_CameraPropertiesPanel(Panel):
     bl_label = "Morph Camera Settings"
@@ -343,6 +623,13 @@ class MORPHCAMERA_PT_CameraPropertiesPanel(Panel):
         scene = context.scene
         morph_props = obj.morph_props # Access the property group
 
+        if not _runtime_initialized:
+            # Rig appeared without a file load (e.g. appended); properties can't be registered while drawing
+            if not bpy.app.timers.is_registered(ensure_morph_runtime):
+                bpy.app.timers.register(ensure_morph_runtime, first_interval=0.0)
+            layout.label(text="Initializing Morph Camera...")
+            return
+
         layout.label(text="Target Cameras:")
         layout.template_list(
             "MORPHCAMERA_UL_CameraList", "",
@@ -362,14 +649,35 @@ class MORPHCAMERA_PT_CameraPropertiesPanel(Panel):
         layout.separator()
 
         # Slider controls
-        if len(morph_props.morph_list) > 1:
-            layout.prop(scene, "morph_slider", text="Morph", slider=True) # Scene property for slider
+        num_cams = len(morph_props.morph_list)
+        if num_cams > 1:
+            row = layout.row(align=True)
+            row.prop(scene, "morph_slider_factor", text="Morph", slider=True) # Normalized scrub slider
+            row.operator("morph_list.scrub", text="", icon='ARROW_LEFTRIGHT') # Throttled modal scrub
+            layout.prop(scene, "morph_slider", text=f"Position (0-{num_cams - 1})") # Keyable absolute value
             layout.prop(morph_props, "arc_control", text="Arc Control", slider=True) # Object property for arc
         else:
             layout.label(text="Add at least two cameras to morph.")
 
         layout.separator()
-        layout.operator("morph_list.bake_morph_camera", text="Bake Animation")
+        row = layout.row(align=True)
+        row.operator("morph_list.bake_morph_camera", text="Bake Animation")
+        row.operator("morph_list.bake_all", text="Bake All Scenes")
+
+        box = layout.box()
+        row = box.row(align=True)
+        row.prop(morph_props, "path_type", expand=True)
+        row = box.row(align=True)
+        row.prop(morph_props, "path_samples", text="Samples")
+        row.prop(morph_props, "path_uniform", text="Even Spacing", toggle=True)
+        box.operator("morph_list.bake_path", text="Update Path" if morph_props.path_object else "Bake Path", icon='CURVE_PATH')
+
+        row = layout.row(align=True)
+        row.operator("morph_list.freeze_for_render", text="Freeze for Render")
+        if _RENDER_TABLE_KEY in obj:
+            row.operator("morph_list.clear_render_table", text="", icon='X')
+            meta = obj.get(_RENDER_META_KEY, {})
+            layout.label(text=f"Frozen: frames {meta.get('frame_start')}-{meta.get('frame_end')}, {meta.get('samples')} sample(s)/frame", icon='FREEZE')
 
 
 # Optional: View 3D Panel (can be removed if Properties panel is enough)
@@ -393,6 +701,38 @@ class MORPHCAMERA_PT_View3DPanel(Panel):
         MORPHCAMERA_PT_CameraPropertiesPanel.draw(self, context)
 
 
+class MORPHCAMERA_PT_ProfilingPanel(Panel):
+    bl_label = "Profiling"
+    bl_idname = "VIEW3D_PT_morph_camera_profiling"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = 'Morph Cam'
+    bl_parent_id = "VIEW3D_PT_morph_camera_ui" # Only shown (like the tab itself) when a morph rig is active
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.window_manager.morph_profiling
+
+        row = layout.row(align=True)
+        row.prop(settings, "enabled", text="Record Timings")
+        row.prop(settings, "log_level", text="")
+
+        stats = _profiler.stats()
+        if stats:
+            col = layout.column(align=True)
+            for name, entry in stats.items():
+                col.label(text=f"{name}: {entry['count']}x  mean {entry['mean_ms']:.3f} ms  p95 {entry['p95_ms']:.3f} ms  total {entry['total_ms']:.1f} ms")
+            for name, (hits, misses) in sorted(_profiler.caches.items()):
+                col.label(text=f"cache {name}: {hits} hit / {misses} miss")
+        elif settings.enabled:
+            layout.label(text="No samples recorded yet.")
+
+        row = layout.row(align=True)
+        row.operator("morph_profiling.reset", text="Reset")
+        row.operator("morph_profiling.export", text="Export JSON")
+
+
 # --- Property Group for Morph Camera ---
 # We store morph-specific properties here, attached to the Object type
 class MorphCameraProperties(PropertyGroup):
@@ -403,13 +743,69 @@ class MorphCameraProperties(PropertyGroup):
         name="Arc Control",
         description="Control the arc of the morphing path (-1 to 1)",
         default=0.0, min=-1.0, max=1.0,
-        subtype='FACTOR'
+        subtype='FACTOR',
+        update=lambda self, context: _arc_control_update(self, context)
+        )
+    # Path preview (see BakeMorphPathOperator)
+    path_object: PointerProperty(name="Path Object", type=bpy.types.Object)
+    path_type: EnumProperty(
+        name="Path Type",
+        items=[
+            ('CURVE', "Curve", "Poly curve object"),
+            ('MESH', "Mesh", "Mesh object with one edge per segment"),
+        ],
+        default='CURVE',
+        update=lambda self, context: _morph_path_settings_update(self, context)
+        )
+    path_samples: IntProperty(
+        name="Path Samples",
+        description="Points sampled between each pair of listed cameras",
+        default=32, min=1, max=4096,
+        update=lambda self, context: _morph_path_settings_update(self, context)
+        )
+    path_uniform: BoolProperty(
+        name="Even Spacing",
+        description="Resample the path to equal arc length so the points are evenly spaced",
+        default=False,
+        update=lambda self, context: _morph_path_settings_update(self, context)
+        )
+
+# --- Session Settings (not saved with the .blend) ---
+def _profiling_enabled_update(self, context):
+    _profiler.enabled = self.enabled
+
+def _log_level_update(self, context):
+    log.setLevel(getattr(logging, self.log_level))
+
+class MorphProfilingSettings(PropertyGroup):
+    enabled: BoolProperty(
+        name="Record Timings",
+        description="Record call counts and timings for handlers, solves and bakes (no overhead when off)",
+        default=False,
+        update=_profiling_enabled_update
+        )
+    log_level: EnumProperty(
+        name="Log Level",
+        description="Minimum level of addon messages printed to the console",
+        items=[
+            ('DEBUG', "Debug", "Print everything, including per-update details"),
+            ('INFO', "Info", "Print progress messages"),
+            ('WARNING', "Warning", "Print only problems (default)"),
+            ('ERROR', "Error", "Print only errors"),
+        ],
+        default='WARNING',
+        update=_log_level_update
         )
 
 # --- Core Logic ---
 
 # Global flag to prevent recursive updates from depsgraph handler
 _update_in_progress_flag = False
+# Set while an operator drives frame_set itself (e.g. freezing), so the frame handler doesn't solve twice
+_frame_handler_suspended = False
+# Set while a list operator assigns cameras itself, so the per-slot update callback doesn't refresh
+# the path and solve for every item; the operator does that once afterwards
+_list_batch_edit = False
 
 def get_evaluated_camera(cam_obj, depsgraph):
     """Safely get the evaluated camera object."""
@@ -418,10 +814,10 @@ def get_evaluated_camera(cam_obj, depsgraph):
     try:
         return cam_obj.evaluated_get(depsgraph)
     except Exception: # Handles cases where object might be invalid (e.g., deleted)
-         print(f"Warning: Could not evaluate camera: {cam_obj.name}")
+         log.warning("Could not evaluate camera: %s", cam_obj.name)
          return None
 
-def get_focus_distance(camera_eval):
+def get_focus_distance(camera_eval, depsgraph=None):
     """Get focus distance from evaluated camera, handling focus object."""
     if not camera_eval or not camera_eval.data:
         return 10.0 # Default value
@@ -429,7 +825,9 @@ def get_focus_distance(camera_eval):
     dof_data = camera_eval.data.dof
     if dof_data.use_dof and dof_data.focus_object:
         try:
-            focus_obj_eval = dof_data.focus_object.evaluated_get(bpy.context.evaluated_depsgraph_get()) # Need current depsgraph
+            if depsgraph is None:
+                depsgraph = bpy.context.evaluated_depsgraph_get() # Need current depsgraph
+            focus_obj_eval = dof_data.focus_object.evaluated_get(depsgraph)
             if focus_obj_eval:
                 return (camera_eval.matrix_world.translation - focus_obj_eval.matrix_world.translation).length
             else:
@@ -444,6 +842,136 @@ def interpolate_bezier(p0, p1, p2, t):
     omt = 1.0 - t
     return omt**2 * p0 + 2.0 * omt * t * p1 + t**2 * p2
 
+def interpolate_location(loc0, loc1, t, arc_control):
+    """Interpolates between two locations, bending the path sideways by arc_control."""
+    if arc_control != 0.0 and loc0 != loc1:
+        mid_point = (loc0 + loc1) / 2.0
+        # Vector from start to end
+        vec = loc1 - loc0
+        # Need a consistent "up" vector - try world Z, fallback to Y if vec is aligned with Z
+        up_vec = Vector((0.0, 0.0, 1.0))
+        if vec.normalized().dot(up_vec) > 0.999 or vec.normalized().dot(up_vec) < -0.999:
+            up_vec = Vector((0.0, 1.0, 0.0))
+        # Perpendicular vector in the plane defined by vec and up_vec
+        perp_vec = vec.cross(up_vec).normalized()
+         # Arc offset strength depends on t (max at t=0.5) and arc_control
+        arc_strength = arc_control * vec.length * 0.5 * (1.0 - abs(2.0 * t - 1.0)) # Scale arc by distance
+        arc_offset = perp_vec * arc_strength
+        # Control point for Bezier curve
+        control_point = mid_point + arc_offset
+        return interpolate_bezier(loc0, control_point, loc1, t)
+    # Linear interpolation if no arc or start/end points are same
+    return loc0.lerp(loc1, t)
+
+def get_camera_snapshot(cam_obj, depsgraph, snapshots=None, resolve_focus=True):
+    """
+    Captures what the solve needs from a source camera:
+    (location, rotation_quaternion, lens, focus_distance, fstop, use_dof), or None if it can't be evaluated.
+    Pass a dict as `snapshots` to share results between rigs evaluated with the same depsgraph.
+    With resolve_focus=False the focus object is ignored and the stored focus distance is used.
+    """
+    if not cam_obj:
+        return None
+    key = cam_obj.as_pointer()
+    if snapshots is not None and key in snapshots:
+        if _profiler.enabled:
+            _profiler.cache("camera_snapshot", True)
+        return snapshots[key]
+
+    cam = get_evaluated_camera(cam_obj, depsgraph)
+    snapshot = None
+    if cam:
+        matrix = cam.matrix_world
+        dof = cam.data.dof
+        if not resolve_focus:
+            focus = dof.focus_distance
+        elif _profiler.enabled:
+            start = perf_counter()
+            focus = get_focus_distance(cam, depsgraph)
+            _profiler.record("focus_distance", perf_counter() - start)
+        else:
+            focus = get_focus_distance(cam, depsgraph)
+        snapshot = (matrix.translation.copy(), matrix.to_quaternion(), cam.data.lens,
+                    focus, dof.aperture_fstop, dof.use_dof)
+    if snapshots is not None:
+        snapshots[key] = snapshot
+        if _profiler.enabled:
+            _profiler.cache("camera_snapshot", False)
+    return snapshot
+
+def solve_morph_state(morph_props, slider_value, depsgraph, snapshots=None):
+    """
+    Solves the morph camera state for a slider value without modifying any object.
+    Returns (location, rotation_quaternion, lens, focus_distance, fstop, use_dof), or None if
+    there is nothing to morph. When only one of the two source cameras can be evaluated the
+    state snaps to it and the DOF entries are None (the morph camera keeps its own DOF).
+    `snapshots` is passed through to get_camera_snapshot.
+    """
+    morph_list = morph_props.morph_list
+    num_cams = len(morph_list)
+
+    if num_cams < 2:
+        return None # Need at least two cameras
+    if _profiler.enabled:
+        start = perf_counter()
+
+    # Clamp slider value to the list's range; stored and keyed slider values are not clamped
+    slider_value = max(0.0, min(slider_value, num_cams - 1.0))
+
+    # Determine which two cameras to interpolate between
+    idx_float = slider_value
+    idx0 = int(idx_float)
+    idx1 = min(idx0 + 1, num_cams - 1) # Ensure idx1 doesn't go out of bounds
+
+    # Get the interpolation factor (t) between cam0 and cam1
+    t = idx_float - idx0
+
+    # Get world space data of the listed cameras from their evaluated versions
+    snap0 = get_camera_snapshot(morph_list[idx0].camera, depsgraph, snapshots)
+    snap1 = get_camera_snapshot(morph_list[idx1].camera, depsgraph, snapshots)
+
+    if not snap0 or not snap1:
+        # If only one camera exists, snap to it; if both are missing, do nothing
+        snap = snap0 or snap1
+        state = (snap[0].copy(), snap[1].copy(), snap[2], None, None, None) if snap else None
+        if _profiler.enabled:
+            _profiler.record("solve", perf_counter() - start)
+        return state
+
+    # --- Interpolation ---
+    loc0, quat0, lens0, focus0, fstop0, use_dof0 = snap0
+    loc1, quat1, lens1, focus1, fstop1, use_dof1 = snap1
+
+    # Rotation (use Slerp for better interpolation)
+    interp_quat = quat0.slerp(quat1, t)
+
+    # Lens and DOF
+    lens = lens0 * (1.0 - t) + lens1 * t
+    focus = focus0 * (1.0 - t) + focus1 * t
+    fstop = fstop0 * (1.0 - t) + fstop1 * t
+    # DOF enabled state (enable if either source cam has it enabled)
+    use_dof = use_dof0 or use_dof1
+    # Add other properties here (clip start/end, sensor size etc.)...
+
+    # Arc Control for Location
+    interp_loc = interpolate_location(loc0, loc1, t, morph_props.arc_control)
+
+    if _profiler.enabled:
+        _profiler.record("solve", perf_counter() - start)
+    return (interp_loc, interp_quat, lens, focus, fstop, use_dof)
+
+def apply_morph_state(morph_cam_obj, state):
+    """Writes a state returned by solve_morph_state onto the morph camera."""
+    location, rotation, lens, focus, fstop, use_dof = state
+    morph_cam_obj.location = location
+    morph_cam_obj.rotation_euler = rotation.to_euler('XYZ') # Use consistent order
+    cam_data = morph_cam_obj.data
+    cam_data.lens = lens
+    if focus is not None:
+        cam_data.dof.focus_distance = focus
+        cam_data.dof.aperture_fstop = fstop
+        cam_data.dof.use_dof = use_dof
+
 def update_morph_camera(scene, morph_cam_obj, depsgraph):
     """
     Updates the transform and properties of the morph_cam_obj based on the morph_list and slider.
@@ -460,127 +988,31 @@ def update_morph_camera(scene, morph_cam_obj, depsgraph):
     _update_in_progress_flag = True # Set flag
 
     try:
-        morph_props = morph_cam_obj.morph_props
-        morph_list = morph_props.morph_list
-        slider_value = scene.morph_slider
-        num_cams = len(morph_list)
-
-        # print(f"Updating Morph Cam '{morph_cam_obj.name}': Slider={slider_value:.2f}, Cams={num_cams}") # Debug
-
-        if num_cams < 2:
-            # print("Not enough cameras in list.")
-            _update_in_progress_flag = False
-            return # Need at least two cameras
-
-        # Clamp slider value to valid range (though slider definition should handle this)
-        slider_value = max(0.0, min(slider_value, num_cams - 1.0))
-
-        # Determine which two cameras to interpolate between
-        idx_float = slider_value
-        idx0 = int(idx_float)
-        idx1 = min(idx0 + 1, num_cams - 1) # Ensure idx1 doesn't go out of bounds
-
-        # Get the interpolation factor (t) between cam0 and cam1
-        t = idx_float - idx0
-
-        # Get the actual camera objects from the list
-        item0 = morph_list[idx0] if idx0 < len(morph_list) else None
-        item1 = morph_list[idx1] if idx1 < len(morph_list) else None
-
-        cam0_orig = item0.camera if item0 else None
-        cam1_orig = item1.camera if item1 else None
-
-        # Get evaluated versions for accurate world space data
-        cam0 = get_evaluated_camera(cam0_orig, depsgraph)
-        cam1 = get_evaluated_camera(cam1_orig, depsgraph)
-
-        if not cam0 or not cam1:
-             # print(f"Warning: Missing evaluated camera for interpolation. Cam0: {cam0}, Cam1: {cam1}")
-             _update_in_progress_flag = False
-             if cam0 and not cam1: # If only cam0 exists, snap to it
-                 morph_cam_obj.location = cam0.matrix_world.translation
-                 morph_cam_obj.rotation_euler = cam0.matrix_world.to_euler('XYZ') # Use consistent order
-                 morph_cam_obj.data.lens = cam0.data.lens
-             elif cam1 and not cam0: # If only cam1 exists, snap to it
-                 morph_cam_obj.location = cam1.matrix_world.translation
-                 morph_cam_obj.rotation_euler = cam1.matrix_world.to_euler('XYZ')
-                 morph_cam_obj.data.lens = cam1.data.lens
-             # else: both missing, do nothing
-             return
-
-        # --- Interpolation ---
-        loc0 = cam0.matrix_world.translation
-        loc1 = cam1.matrix_world.translation
-
-        # Rotation (use Slerp for better interpolation)
-        quat0 = cam0.matrix_world.to_quaternion()
-        quat1 = cam1.matrix_world.to_quaternion()
-        interp_quat = quat0.slerp(quat1, t)
-
-        # Lens and DOF
-        lens0 = cam0.data.lens
-        lens1 = cam1.data.lens
-        focus0 = get_focus_distance(cam0)
-        focus1 = get_focus_distance(cam1)
-        fstop0 = cam0.data.dof.aperture_fstop
-        fstop1 = cam1.data.dof.aperture_fstop
-        # Add other properties here...
-
-        # Arc Control for Location
-        if morph_props.arc_control != 0.0 and loc0 != loc1:
-            mid_point = (loc0 + loc1) / 2.0
-            # Vector from start to end
-            vec = loc1 - loc0
-            # Need a consistent "up" vector - try world Z, fallback to Y if vec is aligned with Z
-            up_vec = Vector((0.0, 0.0, 1.0))
-            if vec.normalized().dot(up_vec) > 0.999 or vec.normalized().dot(up_vec) < -0.999:
-                up_vec = Vector((0.0, 1.0, 0.0))
-            # Perpendicular vector in the plane defined by vec and up_vec
-            perp_vec = vec.cross(up_vec).normalized()
-             # Arc offset strength depends on t (max at t=0.5) and arc_control
-            arc_strength = morph_props.arc_control * vec.length * 0.5 * (1.0 - abs(2.0 * t - 1.0)) # Scale arc by distance
-            arc_offset = perp_vec * arc_strength
-            # Control point for Bezier curve
-            control_point = mid_point + arc_offset
-            interp_loc = interpolate_bezier(loc0, control_point, loc1, t)
-        else:
-            # Linear interpolation if no arc or start/end points are same
-            interp_loc = loc0.lerp(loc1, t)
-
-
-        # --- Apply interpolated values to the Morph Camera ---
-        morph_cam_obj.location = interp_loc
-        morph_cam_obj.rotation_euler = interp_quat.to_euler('XYZ') # Use consistent order
-
-        morph_cam_obj.data.lens = lens0 * (1.0 - t) + lens1 * t
-        morph_cam_obj.data.dof.focus_distance = focus0 * (1.0 - t) + focus1 * t
-        morph_cam_obj.data.dof.aperture_fstop = fstop0 * (1.0 - t) + fstop1 * t
-
-        # Update DOF enabled state (enable if either source cam has it enabled)
-        morph_cam_obj.data.dof.use_dof = cam0.data.dof.use_dof or cam1.data.dof.use_dof
-
-        # Interpolate other camera settings if desired (clip start/end, sensor size etc.)
-        # morph_cam_obj.data.clip_start = cam0.data.clip_start * (1.0 - t) + cam1.data.clip_start * t
-        # morph_cam_obj.data.clip_end = cam0.data.clip_end * (1.0 - t) + cam1.data.clip_end * t
-
-
+        state = solve_morph_state(morph_cam_obj.morph_props, scene.morph_slider, depsgraph)
+        if state is not None:
+            apply_morph_state(morph_cam_obj, state)
     except Exception as e:
-        print(f"Error in update_morph_camera: {e}")
-        import traceback
-        traceback.print_exc() # Print detailed traceback for debugging
+        log.exception("Error in update_morph_camera: %s", e) # Includes the traceback
     finally:
          _update_in_progress_flag = False # Release flag
 
 
 # --- Update Triggers ---
 
+def is_morph_camera_object(obj):
+    """True if obj is a morph camera rig."""
+    # Check both the custom prop (legacy) and the property group flag
+    return obj.type == 'CAMERA' and (obj.get("is_morph_camera") or (hasattr(obj, "morph_props") and obj.morph_props.is_morph_camera))
+
+def find_morph_cameras(scene):
+    """Utility to iterate over all morph cameras in the scene."""
+    for obj in scene.objects:
+        if is_morph_camera_object(obj):
+            yield obj
+
 def find_morph_camera(scene):
     """Utility to find the first morph camera in the scene."""
-    for obj in scene.objects:
-        # Check both the custom prop (legacy) and the property group flag
-        if obj.type == 'CAMERA' and (obj.get("is_morph_camera") or (hasattr(obj, "morph_props") and obj.morph_props.is_morph_camera)):
-            return obj
-    return None
+    return next(find_morph_cameras(scene), None)
 
 def trigger_morph_update(scene, morph_cam_obj=None):
     """Finds the morph camera (if not provided) and calls the update function."""
@@ -588,7 +1020,12 @@ def trigger_morph_update(scene, morph_cam_obj=None):
         morph_cam_obj = find_morph_camera(scene)
 
     if morph_cam_obj:
-        depsgraph = bpy.context.evaluated_depsgraph_get() # Get current depsgraph
+        if _profiler.enabled:
+            start = perf_counter()
+            depsgraph = bpy.context.evaluated_depsgraph_get() # Get current depsgraph
+            _profiler.record("depsgraph_fetch", perf_counter() - start)
+        else:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
         update_morph_camera(scene, morph_cam_obj, depsgraph)
     # else:
         # print("Trigger Morph Update: No Morph Camera found.")
@@ -603,112 +1040,579 @@ def morph_slider_update_callback(self, context):
     trigger_morph_update(self) # Pass the scene
 
 
-# !! NEW Function to define/redefine the Scene property !!
-def register_morph_slider(max_val):
+# --- Morph Slider Storage ---
+# The slider is registered ONCE with get/set accessors. Its valid range is not
+# baked into the RNA definition: solve_morph_state clamps against the rig's list
+# length at evaluation time, so list edits never touch type registration. The
+# length cached on the scene by update_slider_range only drives the UI factor slider.
+_SLIDER_VALUE_KEY = "_morph_slider_value" # Raw (unclamped) slider value
+_SLIDER_MAX_KEY = "_morph_slider_max" # Cached (len(morph_list) - 1) for this scene's UI
+_LEGACY_SLIDER_KEY = "morph_slider" # Storage used by files saved before the get/set slider
+
+def morph_slider_get(self):
+    """Getter for Scene.morph_slider. Not clamped to the list (the cached range may be stale
+    for this scene); the solve clamps against the rig it evaluates."""
+    value = self.get(_SLIDER_VALUE_KEY)
+    if value is None:
+        legacy_storage = legacy_slider_storage(self) # Not migrated yet, read old storage
+        value = legacy_storage[_LEGACY_SLIDER_KEY] if legacy_storage is not None else 0.0
+    return max(0.0, value)
+
+def morph_slider_set(self, value):
+    """Setter for Scene.morph_slider. Stores the raw value; clamping to the list happens in the solve."""
+    # Keeping the raw value means shrinking and re-growing the list restores the position
+    self[_SLIDER_VALUE_KEY] = max(0.0, value)
+
+def morph_slider_factor_get(self):
+    """Getter for the normalized (0-1) view of Scene.morph_slider."""
+    max_val = self.get(_SLIDER_MAX_KEY, 0.0)
+    if max_val <= 0.0:
+        return 0.0
+    return min(1.0, self.morph_slider / max_val)
+
+def morph_slider_factor_set(self, value):
+    """Setter for the normalized view; writes through to Scene.morph_slider (fires its update)."""
+    self.morph_slider = value * self.get(_SLIDER_MAX_KEY, 0.0)
+
+
+def register_morph_slider():
     """
-    Defines or redefines the Scene.morph_slider property.
-    This function should be called whenever the range needs to change.
+    Defines the Scene.morph_slider property (and its normalized UI helper).
+    Called once from register(); the range is resolved at evaluation time, so
+    this never needs to be called again when the list changes.
     """
-    # Ensure max_val is at least 0 for UI sanity, even if list has < 2 items.
-    # The update logic should handle non-morphing states separately anyway.
-    safe_max = max(0.0, float(max_val)) # Ensure it's float
-
-    # Check if property exists before trying to delete (optional safety)
-    if hasattr(bpy.types.Scene, 'morph_slider'):
-         print(f"Deleting existing morph_slider definition before re-registering.")
-         try:
-             # Must delete from the TYPE, not the instance
-             del bpy.types.Scene.morph_slider
-         except Exception as e:
-              print(f"Warning: Could not delete previous morph_slider: {e}")
-
-
-    print(f"Registering Scene.morph_slider with max={safe_max}") # DEBUG
     bpy.types.Scene.morph_slider = FloatProperty(
         name="Morph Slider",
         description="Morph between listed cameras (0=first, 1=second, etc.)",
         default=0.0,
         min=0.0,
-        max=safe_max, # Use the calculated max here
         soft_min=0.0,
-        soft_max=safe_max, # Set soft_max too
         precision=3,
         step=0.01,
-        # subtype='FACTOR', # Ensure subtype is NOT used
+        get=morph_slider_get,
+        set=morph_slider_set,
         update=morph_slider_update_callback # Assign the update callback
     )
+    # Normalized slider for the UI. Not animatable: keyframes always go on morph_slider.
+    bpy.types.Scene.morph_slider_factor = FloatProperty(
+        name="Morph",
+        description="Morph position across the whole camera list (0=first, 1=last)",
+        min=0.0, max=1.0,
+        subtype='FACTOR',
+        options=set(),
+        get=morph_slider_factor_get,
+        set=morph_slider_factor_set,
+    )
 
 
-# !! MODIFIED update_slider_range function !!
-def update_slider_range(scene):
-    """Updates the max value of the morph_slider by potentially redefining the property."""
-    print("Running update_slider_range (redefine method)...") # DEBUG
-    morph_cam_obj = find_morph_camera(scene)
-    target_max_val = 0.0 # Default max if no morph or < 2 cameras
-    num_cams = 0
-    if morph_cam_obj and hasattr(morph_cam_obj, 'morph_props'):
-        num_cams = len(morph_cam_obj.morph_props.morph_list)
-        if num_cams > 1:
-            target_max_val = float(num_cams - 1)
-    print(f"  Target max value based on {num_cams} cameras: {target_max_val}") # DEBUG
-
-    current_max = -1.0 # Flag value indicates not found or error
-    needs_redefine = True # Assume we need to redefine unless proven otherwise
+def legacy_slider_storage(scene):
+    """
+    Returns the IDProperty group holding a morph_slider value saved before the get/set slider,
+    or None. Blender 5.0 keeps bpy.props values apart from custom properties, so the value is
+    no longer readable as scene["morph_slider"] there.
+    """
+    if _LEGACY_SLIDER_KEY in scene:
+        return scene
+    if hasattr(scene, "bl_system_properties_get"): # Blender 5.0+
+        system_props = scene.bl_system_properties_get()
+        if system_props is not None and _LEGACY_SLIDER_KEY in system_props:
+            return system_props
+    return None
 
-    # Check if property exists and read its *current* hard_max
-    if hasattr(bpy.types.Scene, 'morph_slider'):
+def migrate_legacy_slider(scene):
+    """Moves a pre-get/set morph_slider value to the new storage key. Keyframes keep working
+    unchanged since the RNA path is still 'morph_slider'."""
+    if _SLIDER_VALUE_KEY in scene:
+        return
+    legacy_storage = legacy_slider_storage(scene)
+    if legacy_storage is not None:
         try:
-            rna_prop = bpy.types.Scene.bl_rna.properties.get('morph_slider')
-            if rna_prop:
-                # We *can* read hard_max
-                current_max = rna_prop.hard_max
-                print(f"  Current slider hard_max found: {current_max}") # DEBUG
-                # Compare floats with a small tolerance
-                if abs(current_max - target_max_val) < 0.001:
-                    needs_redefine = False
-                    print("  Slider range already correct.") # DEBUG
-            else:
-                print("  Warning: morph_slider exists but couldn't get RNA property.") # DEBUG
+            scene[_SLIDER_VALUE_KEY] = max(0.0, float(legacy_storage[_LEGACY_SLIDER_KEY]))
+            del legacy_storage[_LEGACY_SLIDER_KEY]
         except Exception as e:
-            print(f"  Warning: Error reading current slider max: {e}") # DEBUG
-    else:
-        print("  morph_slider property does not currently exist.") # DEBUG
+            log.warning("Could not migrate morph_slider on scene '%s': %s", scene.name, e)
 
 
-    if needs_redefine:
-        print(f"  Slider range needs update/creation (Target: {target_max_val}). Redefining property.") # DEBUG
-        current_value = 0.0
-        # Store current value *before* deleting/redefining property, if it exists on the scene instance
-        if hasattr(scene, 'morph_slider'):
-             try:
-                 current_value = scene.morph_slider
-                 print(f"  Stored current slider value: {current_value}") # DEBUG
-             except Exception as e:
-                  print(f"  Warning: Could not read current scene.morph_slider value: {e}")
+def update_slider_range(scene, morph_cam_obj=None):
+    """Caches the valid slider range on the scene. O(1); never redefines the property."""
+    if not morph_cam_obj:
+        morph_cam_obj = find_morph_camera(scene)
+    num_cams = 0
+    if morph_cam_obj and hasattr(morph_cam_obj, 'morph_props'):
+        num_cams = len(morph_cam_obj.morph_props.morph_list)
+    target_max_val = float(max(0, num_cams - 1)) # 0.0 if no morph or < 2 cameras
+    if scene.get(_SLIDER_MAX_KEY) != target_max_val:
+        scene[_SLIDER_MAX_KEY] = target_max_val
+        if _profiler.enabled:
+            _profiler.cache("slider_range", False)
+    elif _profiler.enabled:
+        _profiler.cache("slider_range", True)
+    log.debug("Slider range for scene '%s': 0-%s (%d cameras)", scene.name, target_max_val, num_cams)
+
+
+# --- Baking ---
+def new_baked_camera(scene, morph_cam_obj):
+    """Creates the (empty) camera a morph camera gets baked into."""
+    baked_camera_data = bpy.data.cameras.new(name=f"{morph_cam_obj.name}_BakedData")
+    baked_camera_obj = bpy.data.objects.new(name=f"{morph_cam_obj.name}_Baked", object_data=baked_camera_data)
+    scene.collection.objects.link(baked_camera_obj)
+    return baked_camera_obj
+
+# Camera data channels keyed by the bake, in the order sample_bake_frame returns them
+_BAKE_DATA_CHANNELS = ("lens", "dof.focus_distance", "dof.aperture_fstop", "clip_start", "clip_end", "sensor_width", "sensor_height")
+
+def sample_bake_frame(morph_cam_obj, state):
+    """
+    Turns a solved state (see solve_morph_state) into one bake sample:
+    (location, rotation_quaternion, values in _BAKE_DATA_CHANNELS order, use_dof).
+    Whatever the state doesn't provide comes from the morph camera as it is.
+    """
+    cam_data = morph_cam_obj.data
+    if state is None:
+        location, rotation = morph_cam_obj.location.copy(), morph_cam_obj.rotation_euler.to_quaternion()
+        lens, focus, fstop, use_dof = cam_data.lens, None, None, None
+    else:
+        location, rotation, lens, focus, fstop, use_dof = state
+    if focus is None:
+        focus, fstop, use_dof = cam_data.dof.focus_distance, cam_data.dof.aperture_fstop, cam_data.dof.use_dof
+    values = (lens, focus, fstop, cam_data.clip_start, cam_data.clip_end, cam_data.sensor_width, cam_data.sensor_height)
+    return (location, rotation, values, use_dof)
+
+def make_quaternions_continuous(quaternions):
+    """Flips quaternion signs in place so each sample is in the same hemisphere as the previous one."""
+    for i in range(1, len(quaternions)):
+        if quaternions[i - 1].dot(quaternions[i]) < 0.0:
+            quaternions[i].negate()
+
+def quaternions_to_continuous_eulers(quaternions, order='XYZ'):
+    """Converts quaternions to Eulers, each compatible with the previous one (no +-180 degree flips)."""
+    eulers = []
+    previous = None
+    for quaternion in quaternions:
+        euler = quaternion.to_euler(order, previous) if previous is not None else quaternion.to_euler(order)
+        eulers.append(euler)
+        previous = euler
+    return eulers
+
+def find_fcurve(id_data, data_path, index):
+    """Looks up an F-curve of the ID's active action (slotted actions on Blender 4.4+, legacy before)."""
+    anim_data = id_data.animation_data
+    if not anim_data or not anim_data.action:
+        return None
+    action = anim_data.action
+    if bpy.app.version >= (4, 4, 0):
+        from bpy_extras.anim_utils import action_get_channelbag_for_slot
+        channelbag = action_get_channelbag_for_slot(action, anim_data.action_slot)
+        return channelbag.fcurves.find(data_path, index=index) if channelbag else None
+    return action.fcurves.find(data_path, index=index)
+
+def write_fcurve_samples(id_data, data_path, index, frames, values, group=""):
+    """
+    Keys `data_path` (array element `index`, -1 for scalars) of id_data on every frame. The F-curve is
+    created through keyframe_insert, which works with every Action API; the remaining keys are then
+    written in bulk. Returns the key count.
+    """
+    owner_path, _, prop_name = data_path.rpartition(".")
+    owner = id_data.path_resolve(owner_path) if owner_path else id_data
+    owner.keyframe_insert(prop_name, index=index, frame=frames[0], group=group)
+    fcurve = find_fcurve(id_data, data_path, max(index, 0))
+
+    co = [0.0] * (2 * len(frames))
+    co[0::2] = frames
+    co[1::2] = values
+    fcurve.keyframe_points.add(len(frames) - 1) # keyframe_insert already added the first one
+    fcurve.keyframe_points.foreach_set("co", co)
+    fcurve.update() # Recalculates handles
+    return len(frames)
+
+def write_baked_keys(baked_camera_obj, frames, samples, rotation_mode='EULER'):
+    """
+    Writes all bake samples (see sample_bake_frame) to the baked camera and its data.
+    Rotation is keyed as hemisphere-consistent quaternions, or as Eulers made continuous in one pass
+    over the samples. Returns the number of keys written.
+    """
+    keyed = 0
+    for i in range(3):
+        keyed += write_fcurve_samples(baked_camera_obj, "location", i, frames, [sample[0][i] for sample in samples], "Object Transforms")
+
+    rotations = [sample[1].copy() for sample in samples]
+    if rotation_mode == 'QUATERNION':
+        make_quaternions_continuous(rotations)
+        baked_camera_obj.rotation_mode = 'QUATERNION'
+        for i in range(4):
+            keyed += write_fcurve_samples(baked_camera_obj, "rotation_quaternion", i, frames, [q[i] for q in rotations], "Object Transforms")
+    else:
+        eulers = quaternions_to_continuous_eulers(rotations, 'XYZ')
+        baked_camera_obj.rotation_mode = 'XYZ'
+        for i in range(3):
+            keyed += write_fcurve_samples(baked_camera_obj, "rotation_euler", i, frames, [e[i] for e in eulers], "Object Transforms")
 
+    baked_camera_data = baked_camera_obj.data
+    for j, data_path in enumerate(_BAKE_DATA_CHANNELS):
+        keyed += write_fcurve_samples(baked_camera_data, data_path, -1, frames, [sample[2][j] for sample in samples])
 
-        # --- Redefine the property ---
-        # The helper function now handles deletion internally before re-adding
-        register_morph_slider(target_max_val)
-        # --- Property is now redefined ---
+    # Not interpolated by the morph: copied as-is (use_dof as on the last frame)
+    baked_camera_data.dof.use_dof = samples[-1][3]
+    return keyed
 
+def copy_static_camera_settings(baked_camera_obj, morph_cam_obj):
+    """Copies camera settings the morph doesn't animate (sensor fit) to the baked camera."""
+    baked_camera_obj.data.sensor_fit = morph_cam_obj.data.sensor_fit
 
-        # Restore the value to the scene instance, clamping if necessary
-        try:
-             # Clamp between 0.0 and the new target max
-             clamped_value = max(0.0, min(current_value, target_max_val))
-             # Assign to the scene instance property
-             scene.morph_slider = clamped_value
-             print(f"  Restored slider value to: {clamped_value}") # DEBUG
-        except Exception as e:
-             print(f"  Error restoring slider value: {e}") # DEBUG
+def bake_scene_morph_cameras(scene, rigs, rotation_mode='EULER'):
+    """
+    Bakes several morph cameras of one scene in a single pass over its frame range: every frame
+    is set once for all rigs, and source cameras shared by rigs are snapshotted once per frame.
+    Samples are collected first and keyed in bulk afterwards (see write_baked_keys).
+    Returns ([(morph_cam_obj, baked_camera_obj, key_count, seconds)], shared_eval_seconds).
+    """
+    global _frame_handler_suspended
+    # Evaluate each rig in a view layer that actually contains it
+    layers = {} # view layer name -> (view_layer, [entries])
+    entries = []
+    for morph_cam_obj in rigs:
+        view_layer = next((vl for vl in scene.view_layers if morph_cam_obj.name in vl.objects), scene.view_layers[0])
+        entry = [morph_cam_obj, new_baked_camera(scene, morph_cam_obj), [], 0.0] # rig, baked camera, samples, seconds
+        layers.setdefault(view_layer.name, (view_layer, []))[1].append(entry)
+        entries.append(entry)
+
+    original_frame = scene.frame_current
+    frames = list(range(scene.frame_start, scene.frame_end + 1))
+    eval_seconds = 0.0
+    _frame_handler_suspended = True # We solve explicitly below
+    try:
+        for frame in frames:
+            start = perf_counter()
+            scene.frame_set(frame)
+            eval_seconds += perf_counter() - start
+            for view_layer, layer_entries in layers.values():
+                start = perf_counter()
+                view_layer.update() # No-op for the layer frame_set already evaluated
+                depsgraph = view_layer.depsgraph
+                # Read the animated slider from the evaluated scene: for a scene not shown in any
+                # window, the original may not have been written back yet on this frame
+                slider_value = scene.evaluated_get(depsgraph).morph_slider
+                eval_seconds += perf_counter() - start
+                snapshots = {} # Shared by every rig of this view layer at this frame
+                for entry in layer_entries:
+                    start = perf_counter()
+                    morph_cam_obj = entry[0]
+                    state = solve_morph_state(morph_cam_obj.morph_props, slider_value, depsgraph, snapshots)
+                    entry[2].append(sample_bake_frame(morph_cam_obj, state))
+                    entry[3] += perf_counter() - start
+    finally:
+        _frame_handler_suspended = False
+        scene.frame_set(original_frame)
 
-    # If no redefine was needed, still ensure current value is clamped (e.g., if user manually typed > max)
-    elif hasattr(scene, 'morph_slider'):
-         if scene.morph_slider > current_max or scene.morph_slider < 0.0:
-              clamped_value = max(0.0, min(scene.morph_slider, current_max))
-              print(f"Clamping existing slider value {scene.morph_slider} to range [0, {current_max}]. New value: {clamped_value}")
-              scene.morph_slider = clamped_value
+    results = []
+    for morph_cam_obj, baked_camera_obj, samples, seconds in entries:
+        start = perf_counter()
+        copy_static_camera_settings(baked_camera_obj, morph_cam_obj)
+        key_count = write_baked_keys(baked_camera_obj, frames, samples, rotation_mode) if samples else 0
+        results.append((morph_cam_obj, baked_camera_obj, key_count, seconds + perf_counter() - start))
+    return results, eval_seconds
+
+
+# --- Render Path Table ---
+# "Freeze for Render" solves the whole render range up front into a flat float table stored
+# on the morph camera (so it travels with the .blend to the farm). While rendering, the
+# frame handler is swapped for one that only copies the entry for the current (sub)frame.
+_RENDER_TABLE_KEY = "_morph_render_table"
+_RENDER_META_KEY = "_morph_render_meta"
+# Per sample: location(3), rotation_euler(3), lens, focus_distance, fstop, use_dof
+_RENDER_TABLE_STRIDE = 10
+
+# scene name -> list of (morph_cam_obj, start_time, samples_per_frame, sample_count, table)
+_render_tables = {}
+
+def freeze_render_table(scene, morph_cam_obj, subframe_samples=4):
+    """Solves the render range into the camera's render table. Returns the sample count."""
+    global _frame_handler_suspended
+    samples = subframe_samples if scene.render.use_motion_blur else 1
+    # Motion blur evaluates around each frame, so cover one extra frame on both sides
+    pad = int(math.ceil(scene.render.motion_blur_shutter)) if scene.render.use_motion_blur else 0
+    start_time = scene.frame_start - pad
+    count = (scene.frame_end + pad - start_time) * samples + 1
+
+    original_frame = scene.frame_current
+    original_subframe = scene.frame_subframe
+    cam_data = morph_cam_obj.data
+    table = array('d')
+    prev_euler = None
+
+    _frame_handler_suspended = True # We solve explicitly below
+    try:
+        for i in range(count):
+            time = start_time + i / samples
+            frame = int(math.floor(time))
+            scene.frame_set(frame, subframe=time - frame)
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            state = solve_morph_state(morph_cam_obj.morph_props, scene.morph_slider, depsgraph)
+            if state is None:
+                # Nothing to morph at this sample: keep the camera where it is
+                location, euler = morph_cam_obj.location, morph_cam_obj.rotation_euler.copy()
+                lens, focus, fstop, use_dof = cam_data.lens, None, None, None
+            else:
+                location, rotation, lens, focus, fstop, use_dof = state
+                euler = rotation.to_euler('XYZ')
+            if prev_euler is not None:
+                euler.make_compatible(prev_euler) # No flips between neighbouring (sub)frames
+            prev_euler = euler
+            if focus is None:
+                focus, fstop, use_dof = cam_data.dof.focus_distance, cam_data.dof.aperture_fstop, cam_data.dof.use_dof
+            table.extend((location[0], location[1], location[2], euler[0], euler[1], euler[2],
+                          lens, focus, fstop, 1.0 if use_dof else 0.0))
+    finally:
+        _frame_handler_suspended = False
+        scene.frame_set(original_frame, subframe=original_subframe)
+
+    morph_cam_obj[_RENDER_TABLE_KEY] = table.tolist()
+    morph_cam_obj[_RENDER_META_KEY] = {
+        "start": float(start_time),
+        "samples": samples,
+        "count": count,
+        "frame_start": scene.frame_start,
+        "frame_end": scene.frame_end,
+        "signature": render_table_signature(scene, morph_cam_obj),
+    }
+    log.info("Froze %d render samples for '%s' (%d per frame).", count, morph_cam_obj.name, samples)
+    return count
+
+def slider_animation_hash(scene):
+    """CRC of the scene's morph_slider keyframes (points and handles), or the static value if it isn't keyed."""
+    fcurve = find_fcurve(scene, "morph_slider", 0)
+    if fcurve is None:
+        return f"{scene.morph_slider:.6f}"
+    points = fcurve.keyframe_points
+    crc = len(points)
+    for attr in ("co", "handle_left", "handle_right"):
+        values = array('f', [0.0]) * (2 * len(points)) # RNA floats are 32 bit
+        points.foreach_get(attr, values)
+        crc = zlib.crc32(values.tobytes(), crc)
+    return f"{crc:08x}"
+
+def render_table_signature(scene, morph_cam_obj):
+    """
+    Summary of the inputs a frozen table depends on: listed cameras, arc, frame range, motion blur
+    and the slider animation. Changes to the source cameras' own animation need a manual re-freeze.
+    """
+    morph_props = morph_cam_obj.morph_props
+    render = scene.render
+    camera_names = ",".join(item.camera.name if item.camera else "" for item in morph_props.morph_list)
+    return (f"{camera_names}|{morph_props.arc_control:.6f}|{scene.frame_start}-{scene.frame_end}"
+            f"|{render.use_motion_blur:d}:{render.motion_blur_shutter:.6f}|{slider_animation_hash(scene)}")
+
+def clear_render_table(morph_cam_obj):
+    """Drops a frozen render table (it no longer matches once the list changes)."""
+    for key in (_RENDER_TABLE_KEY, _RENDER_META_KEY):
+        if key in morph_cam_obj:
+            del morph_cam_obj[key]
+
+def apply_render_table_sample(morph_cam_obj, table, index):
+    """Copies one frozen sample onto the morph camera."""
+    base = index * _RENDER_TABLE_STRIDE
+    morph_cam_obj.location = table[base:base + 3]
+    morph_cam_obj.rotation_euler = table[base + 3:base + 6]
+    cam_data = morph_cam_obj.data
+    cam_data.lens = table[base + 6]
+    dof = cam_data.dof
+    dof.focus_distance = table[base + 7]
+    dof.aperture_fstop = table[base + 8]
+    dof.use_dof = table[base + 9] > 0.5
+
+def load_render_tables(scene):
+    """Loads the frozen tables of every morph camera in the scene into memory."""
+    entries = []
+    for obj in scene.objects:
+        if obj.type == 'CAMERA' and _RENDER_TABLE_KEY in obj and _RENDER_META_KEY in obj:
+            meta = obj[_RENDER_META_KEY]
+            if meta.get("signature") != render_table_signature(scene, obj):
+                log.warning("Frozen render table of '%s' is out of date (list, arc, frame range, motion blur or slider keys changed); solving live. "
+                            "Use Freeze for Render again.", obj.name)
+                continue
+            entries.append((obj, meta["start"], meta["samples"], meta["count"], array('d', obj[_RENDER_TABLE_KEY])))
+    if entries:
+        _render_tables[scene.name] = entries
+    return entries
+
+def _set_render_frame_handler(enabled):
+    """Swaps the live frame handler for the table lookup handler (or back)."""
+    handlers = bpy.app.handlers.frame_change_post
+    old, new = (morph_frame_change_handler, morph_render_frame_handler) if enabled else (morph_render_frame_handler, morph_frame_change_handler)
+    if old in handlers:
+        handlers.remove(old)
+    if new not in handlers:
+        handlers.append(new)
+
+
+# --- Morph Path Preview ---
+# The solved trajectory is sampled per camera pair (segment). Segments are cached by their
+# endpoints, arc and density, so regenerating after a list edit only re-solves new segments.
+_path_segment_cache = {} # morph camera name -> {segment key: flat [x, y, z, ...] list}
+
+def sample_morph_path(morph_cam_obj, depsgraph, samples_per_segment):
+    """Returns the morph trajectory over the full slider range as a flat [x, y, z, ...] list."""
+    morph_props = morph_cam_obj.morph_props
+    arc = morph_props.arc_control
+    locations = []
+    for item in morph_props.morph_list:
+        cam = get_evaluated_camera(item.camera, depsgraph)
+        locations.append(cam.matrix_world.translation.copy() if cam else None)
+
+    old_cache = _path_segment_cache.get(morph_cam_obj.name, {})
+    new_cache = {}
+    coords = []
+    num_segments = len(locations) - 1
+    for i in range(num_segments):
+        loc0, loc1 = locations[i], locations[i + 1]
+        if loc0 is None or loc1 is None:
+            continue # Empty slot: the path jumps straight across it
+        key = (loc0.to_tuple(), loc1.to_tuple(), arc, samples_per_segment)
+        segment = old_cache.get(key)
+        if _profiler.enabled:
+            _profiler.cache("path_segment", segment is not None)
+        if segment is None:
+            segment = []
+            for k in range(samples_per_segment): # t in [0, 1); the end point starts the next segment
+                segment.extend(interpolate_location(loc0, loc1, k / samples_per_segment, arc))
+        new_cache[key] = segment
+        coords.extend(segment)
+        if i == num_segments - 1 or locations[i + 2] is None:
+            coords.extend(loc1) # Close the run of segments
+    _path_segment_cache[morph_cam_obj.name] = new_cache # Drops segments no longer in use
+    return coords
+
+def resample_polyline(coords, count):
+    """Resamples a flat [x, y, z, ...] polyline to `count` points evenly spaced by arc length."""
+    num_points = len(coords) // 3
+    if num_points < 2 or count < 2:
+        return list(coords)
+    # Cumulative arc length at each input point
+    lengths = [0.0]
+    for i in range(1, num_points):
+        a, b = 3 * (i - 1), 3 * i
+        lengths.append(lengths[-1] + math.sqrt((coords[b] - coords[a]) ** 2 + (coords[b + 1] - coords[a + 1]) ** 2 + (coords[b + 2] - coords[a + 2]) ** 2))
+    total = lengths[-1]
+    if total <= 0.0:
+        return list(coords)
+
+    result = []
+    seg = 0
+    for k in range(count):
+        target = total * k / (count - 1)
+        while seg < num_points - 2 and lengths[seg + 1] < target:
+            seg += 1
+        span = lengths[seg + 1] - lengths[seg]
+        f = (target - lengths[seg]) / span if span > 0.0 else 0.0
+        a, b = 3 * seg, 3 * (seg + 1)
+        result.extend((coords[a] + (coords[b] - coords[a]) * f,
+                       coords[a + 1] + (coords[b + 1] - coords[a + 1]) * f,
+                       coords[a + 2] + (coords[b + 2] - coords[a + 2]) * f))
+    return result
+
+def write_path_object(morph_cam_obj, coords, path_type):
+    """Writes the points into the camera's path object in one go, (re)creating it if needed."""
+    morph_props = morph_cam_obj.morph_props
+    path_obj = morph_props.path_object
+    num_points = len(coords) // 3
+    wanted_type = 'CURVE' if path_type == 'CURVE' else 'MESH'
+
+    if path_obj and path_obj.type != wanted_type:
+        # Switched between curve and mesh: drop the object and its now unused curve/mesh data
+        old_data = path_obj.data
+        bpy.data.objects.remove(path_obj)
+        if old_data and old_data.users == 0:
+            (bpy.data.curves if isinstance(old_data, bpy.types.Curve) else bpy.data.meshes).remove(old_data)
+        path_obj = None
+    if not path_obj:
+        name = f"{morph_cam_obj.name}_Path"
+        if wanted_type == 'CURVE':
+            data = bpy.data.curves.new(name=name, type='CURVE')
+            data.dimensions = '3D'
+        else:
+            data = bpy.data.meshes.new(name=name)
+        path_obj = bpy.data.objects.new(name=name, object_data=data)
+        path_obj.hide_render = True # Preview only
+        for collection in morph_cam_obj.users_collection:
+            collection.objects.link(path_obj)
+        morph_props.path_object = path_obj
+
+    if wanted_type == 'CURVE':
+        curve = path_obj.data
+        spline = curve.splines[0] if len(curve.splines) == 1 else None
+        if spline is None or spline.type != 'POLY' or len(spline.points) != num_points:
+            curve.splines.clear()
+            spline = curve.splines.new('POLY')
+            spline.points.add(num_points - 1) # A new spline starts with one point
+        co = [1.0] * (num_points * 4) # Curve points are (x, y, z, w)
+        co[0::4] = coords[0::3]
+        co[1::4] = coords[1::3]
+        co[2::4] = coords[2::3]
+        spline.points.foreach_set("co", co)
+        curve.update_tag()
+    else:
+        mesh = path_obj.data
+        if len(mesh.vertices) != num_points or len(mesh.edges) != num_points - 1:
+            # Topology changed: start from a fresh mesh rather than editing in place
+            new_mesh = bpy.data.meshes.new(name=mesh.name)
+            new_mesh.vertices.add(num_points)
+            new_mesh.edges.add(num_points - 1)
+            edge_indices = []
+            for i in range(num_points - 1):
+                edge_indices.extend((i, i + 1))
+            new_mesh.edges.foreach_set("vertices", edge_indices)
+            path_obj.data = new_mesh
+            bpy.data.meshes.remove(mesh)
+            mesh = new_mesh
+        mesh.vertices.foreach_set("co", coords)
+        mesh.update()
+
+def refresh_morph_path(morph_cam_obj, depsgraph=None, create=False):
+    """
+    Regenerates the camera's path object from the current list and settings.
+    Does nothing unless the path was baked before (or create is True). Returns the point count.
+    """
+    morph_props = morph_cam_obj.morph_props
+    if not (create or morph_props.path_object):
+        return 0
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    coords = sample_morph_path(morph_cam_obj, depsgraph, morph_props.path_samples)
+    if morph_props.path_uniform:
+        coords = resample_polyline(coords, len(coords) // 3)
+    num_points = len(coords) // 3
+    if num_points < 2:
+        return num_points
+    write_path_object(morph_cam_obj, coords, morph_props.path_type)
+    return num_points
+
+def _morph_path_settings_update(self, context):
+    """Update callback for arc control and path settings on MorphCameraProperties."""
+    morph_cam_obj = self.id_data
+    refresh_morph_path(morph_cam_obj)
+    if context.scene.camera == morph_cam_obj:
+        trigger_morph_update(context.scene, morph_cam_obj)
+
+def _arc_control_update(self, context):
+    """Update callback for arc_control: the frozen table no longer matches the path."""
+    clear_render_table(self.id_data)
+    _morph_path_settings_update(self, context)
+
+def _morph_list_item_camera_update(self, context):
+    """Update callback for MorphListItem.camera (e.g. filling an empty slot in the UI list)."""
+    if _list_batch_edit:
+        return # The list operator refreshes once after its edits
+    morph_cam_obj = self.id_data
+    ensure_morph_runtime()
+    on_morph_list_changed(morph_cam_obj)
+    update_slider_range(context.scene, morph_cam_obj)
+    if context.scene.camera == morph_cam_obj:
+        trigger_morph_update(context.scene, morph_cam_obj)
+
+def on_morph_list_changed(morph_cam_obj):
+    """Called by the list operators after the morph list was edited."""
+    clear_render_table(morph_cam_obj) # No longer matches the list
+    refresh_morph_path(morph_cam_obj)
 
 
 # --- Application Handlers ---
@@ -721,7 +1625,52 @@ def morph_frame_change_handler(scene, depsgraph=None):
     # print(f"Frame Change Handler: Frame {scene.frame_current}") # Debug
     # The depsgraph is sometimes passed on frame change post, sometimes not.
     # It's more reliable to get it inside trigger_morph_update if needed.
-    trigger_morph_update(scene)
+    if _frame_handler_suspended:
+        return
+    if _profiler.enabled:
+        start = perf_counter()
+        trigger_morph_update(scene)
+        _profiler.record("handler.frame_change", perf_counter() - start)
+    else:
+        trigger_morph_update(scene)
+
+@bpy.app.handlers.persistent
+def morph_render_frame_handler(scene, depsgraph=None):
+    """Frame handler used during final renders: applies frozen samples instead of solving."""
+    if _profiler.enabled:
+        start = perf_counter()
+    entries = _render_tables.get(scene.name)
+    if entries is None:
+        trigger_morph_update(scene) # Scene without a frozen table (e.g. a scene strip)
+    else:
+        time = scene.frame_current + scene.frame_subframe
+        for morph_cam_obj, start_time, samples, count, table in entries:
+            index = int(round((time - start_time) * samples))
+            if 0 <= index < count:
+                apply_render_table_sample(morph_cam_obj, table, index)
+            else:
+                log.warning("Frame %s is outside the frozen range of '%s', solving live.", time, morph_cam_obj.name)
+                trigger_morph_update(scene, morph_cam_obj)
+    if _profiler.enabled:
+        _profiler.record("handler.render_frame", perf_counter() - start)
+
+@bpy.app.handlers.persistent
+def morph_render_init_handler(scene, depsgraph=None):
+    """Before a render job: switch to table lookups if any morph camera was frozen."""
+    _render_tables.clear()
+    if load_render_tables(scene):
+        _set_render_frame_handler(True)
+        # Scenes used as strips/compositor inputs get looked up by name from the handler
+        for other_scene in bpy.data.scenes:
+            if other_scene != scene:
+                load_render_tables(other_scene)
+
+@bpy.app.handlers.persistent
+def morph_render_complete_handler(scene, depsgraph=None):
+    """After a render job (finished or cancelled): restore the live solve path."""
+    if _render_tables:
+        _render_tables.clear()
+        _set_render_frame_handler(False)
 
 @bpy.app.handlers.persistent
 def morph_depsgraph_update_handler(scene, depsgraph):
@@ -729,27 +1678,94 @@ def morph_depsgraph_update_handler(scene, depsgraph):
     # This runs VERY often. Use with caution.
     # Useful if source cameras are animated or constrained.
     # print("Depsgraph Handler Triggered") # Debug - Warning: Very frequent!
-    trigger_morph_update(scene) # Depsgraph already available
+    if _profiler.enabled:
+        start = perf_counter()
+        trigger_morph_update(scene) # Depsgraph already available
+        _profiler.record("handler.depsgraph_update", perf_counter() - start)
+    else:
+        trigger_morph_update(scene)
 
 @bpy.app.handlers.persistent
 def morph_load_post_handler(dummy):
-    """Handler run once after a .blend file is loaded."""
-    print("Morph Cam Addon: Load Post Handler Running...")
-    scene = bpy.context.scene
-    if not scene:
-        print("Load Handler: No scene context.")
-        return
+    """Handler run once after a .blend file is loaded. Does almost nothing for files without rigs."""
+    if _profiler.enabled:
+        start = perf_counter()
+    has_rigs = file_has_morph_rigs()
+    for loaded_scene in bpy.data.scenes:
+        morph_cam_obj = find_morph_camera(loaded_scene) if has_rigs else None
+        if not morph_cam_obj:
+            continue
+        ensure_morph_runtime()
+        # Move slider values saved by older versions to the get/set storage
+        migrate_legacy_slider(loaded_scene)
+        # Need to re-evaluate the slider range after load
+        update_slider_range(loaded_scene, morph_cam_obj)
+
+    if has_rigs:
+        # Trigger an initial update for the morph camera based on loaded slider value.
+        # Other scenes are solved by the frame handler when they are evaluated/rendered.
+        scene = bpy.context.scene
+        if scene:
+            trigger_morph_update(scene)
+        log.debug("Initial update triggered after load.")
+    if _profiler.enabled:
+        _profiler.record("handler.load_post", perf_counter() - start)
+
+
+# --- Deferred Runtime Initialization ---
+# Files without morph rigs (the common case for pipeline/farm processes) never register the
+# slider property or the per-frame/render handlers; ensure_morph_runtime does that on first use.
+_runtime_initialized = False
+
+def file_has_morph_rigs():
+    """Cheap check whether the loaded file contains a morph rig."""
+    if not bpy.data.cameras:
+        return False
+    # Only look at objects using camera data; user_map walks the file in C
+    camera_users = bpy.data.user_map(subset=bpy.data.cameras, value_types={'OBJECT'})
+    for users in camera_users.values():
+        for obj in users:
+            if is_morph_camera_object(obj):
+                return True
+    return False
+
+def _runtime_handlers():
+    """Handlers that are only needed once a morph rig exists."""
+    return [
+        # Frame change post often works well as constraints/drivers have evaluated
+        (bpy.app.handlers.frame_change_post, morph_frame_change_handler),
+        # (bpy.app.handlers.depsgraph_update_post, morph_depsgraph_update_handler), # Uncomment if needed, but performance heavy
+        # Render jobs: render_init/complete/cancel run once per job, around all frame changes
+        # (render_pre/post run per frame, *after* the frame handler already solved)
+        (bpy.app.handlers.render_init, morph_render_init_handler),
+        (bpy.app.handlers.render_complete, morph_render_complete_handler),
+        (bpy.app.handlers.render_cancel, morph_render_complete_handler),
+    ]
 
-    # Need to re-evaluate the slider range after load
-    update_slider_range(scene)
+def ensure_morph_runtime():
+    """
+    Registers the slider property and the runtime handlers, once.
+    Returns None so it can also be used as a one-shot bpy.app.timers callback.
+    """
+    global _runtime_initialized
+    if _runtime_initialized:
+        return None
+    _runtime_initialized = True
 
-    # Trigger an initial update for the morph camera based on loaded slider value
-    trigger_morph_update(scene)
-    print("Morph Cam Addon: Initial update triggered after load.")
+    # Register the slider property once; its range is resolved per scene at evaluation time
+    register_morph_slider()
+    for handler_list, handler_func in _runtime_handlers():
+        if handler_func not in handler_list:
+            handler_list.append(handler_func)
+            _registered_handlers.append((handler_list, handler_func)) # Store for unregister
+    log.info("Morph camera runtime initialized.")
+    return None
 
 
 # List to keep track of registered handlers for easy removal
 _registered_handlers = []
+# Keymap items added to the addon keyconfig, for removal on unregister
+_addon_keymaps = []
 
 # --- Registration ---
 classes = (
@@ -762,29 +1778,33 @@ classes = (
     RemoveCameraFromListOperator,
     MoveCameraUpOperator,
     MoveCameraDownOperator,
+    ScrubMorphSliderOperator,
     BakeMorphCameraOperator,
+    BakeAllMorphCamerasOperator,
+    BakeMorphPathOperator,
+    FreezeMorphForRenderOperator,
+    ClearMorphRenderTableOperator,
+    ResetMorphProfilingOperator,
+    ExportMorphProfilingOperator,
     MORPHCAMERA_PT_CameraPropertiesPanel,
     MORPHCAMERA_PT_View3DPanel,
+    MORPHCAMERA_PT_ProfilingPanel,
+    MorphProfilingSettings,
 )
 
 def register():
-    print("Registering Morph Camera Addon (Fixed)...")
+    log.info("Registering Morph Camera Addon...")
     for cls in classes:
         bpy.utils.register_class(cls)
 
     # Assign the PropertyGroup to the Object type
     bpy.types.Object.morph_props = PointerProperty(type=MorphCameraProperties)
-
-    # Perform initial registration of the slider property
-    # Use a sensible default, like 1.0 (for 2 cameras) or 0.0 if preferred when no list exists yet
-    register_morph_slider(1.0)
-
+    bpy.types.WindowManager.morph_profiling = PointerProperty(type=MorphProfilingSettings)
 
     # Register handlers
-    # Frame change post often works well as constraints/drivers have evaluated
+    # Only the load handler is needed up front: it detects rigs and calls ensure_morph_runtime,
+    # which registers the slider property and the frame/render handlers
     handlers_to_register = [
-        (bpy.app.handlers.frame_change_post, morph_frame_change_handler),
-        # (bpy.app.handlers.depsgraph_update_post, morph_depsgraph_update_handler), # Uncomment if needed, but performance heavy
         (bpy.app.handlers.load_post, morph_load_post_handler),
     ]
 
@@ -800,10 +1820,22 @@ def register():
     # Add button to Add > Camera menu
     bpy.types.VIEW3D_MT_camera_add.append(add_morph_camera_button_draw)
 
-    print(f"Morph Camera Addon Registered. Handlers: {_registered_handlers}")
+    # Alt+Shift+M in the 3D Viewport scrubs the active morph camera
+    keyconfig = bpy.context.window_manager.keyconfigs.addon
+    if keyconfig: # None in background mode
+        keymap = keyconfig.keymaps.new(name="3D View", space_type='VIEW_3D')
+        keymap_item = keymap.keymap_items.new(ScrubMorphSliderOperator.bl_idname, type='M', value='PRESS', alt=True, shift=True)
+        _addon_keymaps.append((keymap, keymap_item))
+
+    # Enabling the addon with a file already open doesn't fire load_post, so check once when idle
+    # (timers don't run in background mode, where files are always loaded after registration)
+    if not bpy.app.background:
+        bpy.app.timers.register(functools.partial(morph_load_post_handler, None), first_interval=0.0)
+
+    log.info("Morph Camera Addon Registered. Handlers: %s", _registered_handlers)
 
 def unregister():
-    print("Unregistering Morph Camera Addon (Fixed - Redefine Slider)...")
+    log.info("Unregistering Morph Camera Addon...")
 
     global _registered_handlers
     # Remove handlers safely
@@ -812,24 +1844,35 @@ def unregister():
             try:
                 handler_list.remove(handler_func)
             except Exception as e:
-                 print(f"Error removing handler {handler_func.__name__}: {e}")
+                 log.error("Error removing handler %s: %s", handler_func.__name__, e)
     _registered_handlers.clear()
+    # The table lookup handler is only installed while a render job runs
+    if morph_render_frame_handler in bpy.app.handlers.frame_change_post:
+        bpy.app.handlers.frame_change_post.remove(morph_render_frame_handler)
+    _render_tables.clear()
 
 
     # Remove button from menu
     try:
         bpy.types.VIEW3D_MT_camera_add.remove(add_morph_camera_button_draw)
     except Exception as e:
-         print(f"Error removing menu item: {e}")
-
+         log.error("Error removing menu item: %s", e)
 
-    # Delete the scene property definition IF it exists
-    if hasattr(bpy.types.Scene, 'morph_slider'):
+    for keymap, keymap_item in _addon_keymaps:
         try:
-            del bpy.types.Scene.morph_slider
-            print("Unregistered morph_slider property definition.") # DEBUG
+            keymap.keymap_items.remove(keymap_item)
         except Exception as e:
-             print(f"Error deleting morph_slider property definition during unregister: {e}")
+             log.error("Error removing keymap item: %s", e)
+    _addon_keymaps.clear()
+
+
+    # Delete the scene property definitions IF they exist
+    for prop_name in ('morph_slider_factor', 'morph_slider'):
+        if hasattr(bpy.types.Scene, prop_name):
+            try:
+                delattr(bpy.types.Scene, prop_name)
+            except Exception as e:
+                 log.error("Error deleting %s property definition during unregister: %s", prop_name, e)
 
 
     # Delete the property group pointer from Object type
@@ -838,7 +1881,15 @@ def unregister():
         if hasattr(bpy.types.Object, 'morph_props'):
              del bpy.types.Object.morph_props
     except Exception as e:
-         print(f"Error deleting Object.morph_props during unregister: {e}")
+         log.error("Error deleting Object.morph_props during unregister: %s", e)
+    try:
+        if hasattr(bpy.types.WindowManager, 'morph_profiling'):
+             del bpy.types.WindowManager.morph_profiling
+    except Exception as e:
+         log.error("Error deleting WindowManager.morph_profiling during unregister: %s", e)
+    _profiler.enabled = False
+    global _runtime_initialized
+    _runtime_initialized = False
 
 
     # Unregister classes in reverse order
@@ -846,10 +1897,10 @@ def unregister():
         try:
             bpy.utils.unregister_class(cls)
         except Exception as e:
-             print(f"Error unregistering class {cls.__name__}: {e}")
+             log.error("Error unregistering class %s: %s", cls.__name__, e)
 
 
-    print("Morph Camera Addon Unregistered.")
+    log.info("Morph Camera Addon Unregistered.")
 
 
 # --- Menu item drawing function ---